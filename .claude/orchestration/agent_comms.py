@@ -7,6 +7,53 @@ import re
 from typing import Dict, List, Optional
 
 
+# Allowed handoff priorities and response statuses
+_VALID_PRIORITIES = frozenset({'low', 'medium', 'high'})
+_VALID_STATUSES = frozenset({'success', 'error', 'blocked'})
+
+# Comment patterns stripped from interface definitions
+_LINE_COMMENT_RE = re.compile(r'//.*$', re.MULTILINE)
+_BLOCK_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+
+# Whitespace surrounding structural punctuation
+_PUNCT_TRIM_RE = re.compile(r'\s*([:;{}(),])\s*')
+
+# Cheap presence checks used to skip no-op compression passes
+_EXTRA_WHITESPACE_RE = re.compile(r'[^\S ]| {2}|^ | $')
+_PUNCT_SPACE_RE = re.compile(r'\s[:;{}(),]|[:;{}(),]\s')
+
+# Shared compact encoder (non-default separators bypass json.dumps' cached encoder)
+_COMPACT_ENCODER = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+
+# Prefer a faster JSON backend if one is installed. Every backend emits the
+# same compact text (no ASCII or "/" escaping) and is measured in characters,
+# so estimates don't depend on which package is present
+try:
+    import orjson
+
+    def _compact_json_length(obj) -> int:
+        """Character length of the compact JSON encoding of obj."""
+        return len(orjson.dumps(obj).decode())
+except ImportError:
+    try:
+        import ujson
+
+        def _compact_json_length(obj) -> int:
+            """Character length of the compact JSON encoding of obj."""
+            return len(ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False))
+    except ImportError:
+        def _compact_json_length(obj) -> int:
+            """Character length of the compact JSON encoding of obj."""
+            return len(_COMPACT_ENCODER.encode(obj))
+
+
+def _bullets(items: List[str], empty: str = '') -> str:
+    """Render items as an indented '- item' list, or `empty` if there are none."""
+    if not items:
+        return empty
+    return '\n'.join(f'   - {item}' for item in items)
+
+
 class AgentHandoff:
     """Structured context passing between agents."""
 
@@ -69,7 +116,7 @@ class AgentHandoff:
         if token_budget < 500 or token_budget > 3000:
             errors.append(f"Token budget out of range ({token_budget} not in 500-3000)")
 
-        if priority not in ['low', 'medium', 'high']:
+        if priority not in _VALID_PRIORITIES:
             errors.append(f"Invalid priority: {priority}")
 
         if errors:
@@ -111,8 +158,7 @@ class AgentHandoff:
         Returns:
             Estimated token count
         """
-        content = json.dumps(handoff, separators=(',', ':'))  # Compact JSON
-        return len(content) // 4
+        return _compact_json_length(handoff) // 4
 
     @staticmethod
     def compress_interfaces(interfaces: Dict[str, str]) -> Dict[str, str]:
@@ -128,23 +174,25 @@ class AgentHandoff:
         compressed = {}
 
         for name, definition in interfaces.items():
+            # Each pass is skipped when there is nothing for it to remove,
+            # so already-compact definitions pass through almost for free
+            clean = definition
+
             # Remove single-line comments
-            clean = re.sub(r'//.*$', '', definition, flags=re.MULTILINE)
+            if '//' in clean:
+                clean = _LINE_COMMENT_RE.sub('', clean)
 
             # Remove multi-line comments
-            clean = re.sub(r'/\*.*?\*/', '', clean, flags=re.DOTALL)
+            if '/*' in clean:
+                clean = _BLOCK_COMMENT_RE.sub('', clean)
 
             # Remove extra whitespace
-            clean = ' '.join(clean.split())
+            if _EXTRA_WHITESPACE_RE.search(clean):
+                clean = ' '.join(clean.split())
 
             # Remove spaces around common characters
-            clean = clean.replace(' : ', ':')
-            clean = clean.replace(' ; ', ';')
-            clean = clean.replace(' { ', '{')
-            clean = clean.replace(' } ', '}')
-            clean = clean.replace(' , ', ',')
-            clean = clean.replace('( ', '(')
-            clean = clean.replace(' )', ')')
+            if _PUNCT_SPACE_RE.search(clean):
+                clean = _PUNCT_TRIM_RE.sub(r'\1', clean)
 
             compressed[name] = clean.strip()
 
@@ -229,7 +277,7 @@ class AgentHandoff:
                 errors.append(f"Missing required field: {field}")
 
         # Status validation
-        if response.get('status') not in ['success', 'error', 'blocked']:
+        if response.get('status') not in _VALID_STATUSES:
             errors.append(f"Invalid status: {response.get('status')}")
 
         # Error status requires errors field
@@ -263,13 +311,13 @@ class AgentHandoff:
    {handoff['taskDescription']}
 
 🔧 Dependencies ({len(handoff['dependencies'])}):
-   {chr(10).join(f'   - {dep}' for dep in handoff['dependencies'])}
+   {_bullets(handoff['dependencies'])}
 
 ⚠️  Critical Notes ({len(handoff['criticalNotes'])}):
-   {chr(10).join(f'   - {note}' for note in handoff['criticalNotes'])}
+   {_bullets(handoff['criticalNotes'])}
 
 🧪 Test Requirements ({len(handoff['testRequirements'])}):
-   {chr(10).join(f'   - {req}' for req in handoff['testRequirements'])}
+   {_bullets(handoff['testRequirements'])}
 
 💾 Token Budget: {handoff['tokenBudget']} tokens
    Estimated Usage: {AgentHandoff.estimate_tokens(handoff)} tokens
@@ -294,6 +342,8 @@ class AgentHandoff:
         }
 
         emoji = status_emoji.get(response['status'], '❓')
+        files_created = response.get('filesCreated', [])
+        tests = response.get('tests', [])
 
         summary = f"""
 {emoji} Task {response['taskId']} - {response['status'].upper()}
@@ -302,23 +352,23 @@ class AgentHandoff:
    Token Usage: {response['tokenUsage']} tokens
 
 📁 Files Modified ({len(response['filesModified'])}):
-   {chr(10).join(f'   - {file}' for file in response['filesModified']) or '   (none)'}
+   {_bullets(response['filesModified'], '   (none)')}
 
-📁 Files Created ({len(response.get('filesCreated', []))}):
-   {chr(10).join(f'   - {file}' for file in response.get('filesCreated', [])) or '   (none)'}
+📁 Files Created ({len(files_created)}):
+   {_bullets(files_created, '   (none)')}
 
-🧪 Tests ({len(response.get('tests', []))}):
-   {chr(10).join(f'   - {test}' for test in response.get('tests', [])) or '   (none)'}
+🧪 Tests ({len(tests)}):
+   {_bullets(tests, '   (none)')}
 """
 
         if response.get('warnings'):
-            summary += f"\n⚠️  Warnings:\n   {chr(10).join(f'   - {w}' for w in response['warnings'])}"
+            summary += f"\n⚠️  Warnings:\n   {_bullets(response['warnings'])}"
 
         if response.get('errors'):
-            summary += f"\n❌ Errors:\n   {chr(10).join(f'   - {e}' for e in response['errors'])}"
+            summary += f"\n❌ Errors:\n   {_bullets(response['errors'])}"
 
         if response.get('blockers'):
-            summary += f"\n⏸️  Blockers:\n   {chr(10).join(f'   - {b}' for b in response['blockers'])}"
+            summary += f"\n⏸️  Blockers:\n   {_bullets(response['blockers'])}"
 
         return summary.strip()
 
@@ -6,8 +6,32 @@ Eliminates need to manually update routing config for new interfaces.
 """
 
 from typing import Dict, List, Set, Optional, Tuple
+from collections import Counter, OrderedDict, defaultdict
 import re
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
+
+
+# Agent types that interfaces are routed to (interned: used as hot dict keys)
+_AGENTS: Tuple[str, ...] = tuple(
+    sys.intern(agent) for agent in ('frontend', 'physics', 'state', 'testing', 'config', 'performance')
+)
+
+# Plain word keywords (eligible for the combined content scan)
+_WORD_RE = re.compile(r'\w+')
+
+# Rule patterns that only match a literal, end-anchored suffix (e.g. 'Props$')
+_LITERAL_SUFFIX_RE = re.compile(r'([A-Za-z]+)\$')
+
+
+@lru_cache(maxsize=64)
+def _keyword_pattern(keywords: Tuple[str, ...]) -> re.Pattern:
+    """Compile one case-insensitive word-boundary alternation for a keyword list."""
+    return re.compile(
+        r'\b(?:' + '|'.join(re.escape(keyword) for keyword in keywords) + r')\b',
+        re.IGNORECASE
+    )
 
 
 @dataclass
@@ -17,10 +41,14 @@ class RoutingRule:
     agents: List[str]  # Target agents
     confidence: float = 1.0  # Confidence score (0-1)
     source: str = "manual"  # "manual", "pattern", "learned"
+    _compiled: re.Pattern = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._compiled = re.compile(self.pattern, re.IGNORECASE)
     
     def matches(self, interface_name: str) -> bool:
         """Check if interface matches this rule."""
-        return bool(re.search(self.pattern, interface_name, re.IGNORECASE))
+        return self._compiled.search(interface_name) is not None
 
 
 class AutoInterfaceRouter:
@@ -35,6 +63,18 @@ class AutoInterfaceRouter:
     5. Confidence scoring for routing decisions
     """
     
+    # Name fragments used to suggest agents for unmapped interfaces (case-sensitive)
+    _NAME_TO_AGENTS: List[Tuple[re.Pattern, str]] = [
+        (re.compile(r'Props'), 'frontend'),
+        (re.compile(r'Store|State'), 'state'),
+        (re.compile(r'Collision|Force|Physics|Rigid'), 'physics'),
+        (re.compile(r'Config'), 'config'),
+        (re.compile(r'Test|Mock'), 'testing'),
+    ]
+    
+    # Number of interfaces whose routing decisions are memoized
+    _CLASSIFICATION_CACHE_SIZE = 4096
+    
     def __init__(self):
         # Core routing rules (pattern-based)
         self.routing_rules: List[RoutingRule] = self._initialize_patterns()
@@ -43,7 +83,8 @@ class AutoInterfaceRouter:
         self.explicit_mappings: Dict[str, List[str]] = {}
         
         # Learned mappings from usage patterns
-        self.learned_mappings: Dict[str, Dict[str, int]] = {}  # {interface: {agent: usage_count}}
+        self.learned_mappings: Dict[str, Counter] = defaultdict(Counter)  # {interface: {agent: usage_count}}
+        self._learned_totals: Counter = Counter()  # {interface: total usage_count}
         
         # Shared interfaces (available to all)
         self.shared_interfaces: Set[str] = {
@@ -70,6 +111,15 @@ class AutoInterfaceRouter:
             'config': ['config', 'settings', 'options', 'params'],
             'performance': ['performance', 'optimization', 'memo', 'cache', 'fps'],
         }
+        
+        # Memoized routing decisions for every agent, one entry per interface
+        # body, least recently used evicted first:
+        # {(interface, definition): {agent: (route, confidence, source)}}
+        self._classification_cache: 'OrderedDict[Tuple[str, str], Dict[str, Tuple[bool, float, str]]]' = OrderedDict()
+        
+        # Lookup indexes derived from routing_rules, dependency_graph and
+        # content_keywords; rebuilt by _refresh_indexes when those change
+        self._compile_indexes()
     
     def _initialize_patterns(self) -> List[RoutingRule]:
         """Initialize pattern-based routing rules."""
@@ -107,6 +157,134 @@ class AutoInterfaceRouter:
             RoutingRule(r'Asset$', ['state', 'frontend'], 0.8, 'pattern'),
         ]
     
+    def _config_snapshot(self) -> tuple:
+        """Contents of the public routing configuration the indexes derive from."""
+        return (
+            tuple((rule.pattern, tuple(rule.agents), rule.confidence) for rule in self.routing_rules),
+            tuple((agent, tuple(deps)) for agent, deps in self.dependency_graph.items()),
+            tuple((agent, tuple(keywords)) for agent, keywords in self.content_keywords.items()),
+        )
+    
+    def _compile_indexes(self):
+        """Build every lookup index from the current routing configuration."""
+        self._indexed_config = self._config_snapshot()
+        self._compile_rule_index()
+        self._compile_dependency_closure()
+        self._compile_content_index()
+    
+    def _refresh_indexes(self):
+        """
+        Rebuild the indexes (and drop memoized decisions) if routing_rules,
+        dependency_graph or content_keywords were edited since they were built.
+        
+        Compares contents rather than sizes, so in-place edits are seen; the
+        configuration is a few dozen entries, so this is cheap per call.
+        """
+        if self._config_snapshot() != self._indexed_config:
+            self._compile_indexes()
+            self._classification_cache.clear()
+    
+    def _compile_content_index(self):
+        """Precompile the content keyword patterns and keyword → agents index."""
+        # One precompiled word-boundary alternation per agent's keywords
+        # (shared across router instances with the same keyword lists)
+        self._content_patterns: Dict[str, re.Pattern] = {
+            agent: _keyword_pattern(tuple(keywords))
+            for agent, keywords in self.content_keywords.items()
+            if keywords
+        }
+        
+        # Keyword → agents index for scanning a definition once for all agents.
+        # Only valid when every keyword is a plain word: then each match is a
+        # whole word, exactly as the per-agent patterns would find it.
+        self._keyword_agents: Dict[str, List[str]] = {}
+        for agent, keywords in self.content_keywords.items():
+            for keyword in keywords:
+                agents = self._keyword_agents.setdefault(keyword.lower(), [])
+                if agent not in agents:
+                    agents.append(agent)
+        self._all_keywords_re: Optional[re.Pattern] = (
+            _keyword_pattern(tuple(self._keyword_agents))
+            if self._keyword_agents and all(_WORD_RE.fullmatch(k) for k in self._keyword_agents)
+            else None
+        )
+    
+    def _compile_rule_index(self):
+        """
+        Index routing rules for fast matching.
+        
+        Rules that are a plain literal suffix (e.g. 'Props$') are keyed by their
+        lowercased suffix, so matching them is a dict lookup per suffix length.
+        The remaining rules are combined into one regex where each rule is an
+        optional lookahead with a named group, so a single match call at
+        position 0 reports every rule that matches the name.
+        """
+        self._suffix_rules: Dict[str, List[Tuple[int, RoutingRule]]] = {}
+        self._rule_groups: List[Tuple[int, str, RoutingRule]] = []
+        
+        for i, rule in enumerate(self.routing_rules):
+            suffix = _LITERAL_SUFFIX_RE.fullmatch(rule.pattern)
+            if suffix:
+                self._suffix_rules.setdefault(suffix.group(1).lower(), []).append((i, rule))
+            else:
+                self._rule_groups.append((i, f'r{i}', rule))
+        
+        self._suffix_lengths = sorted({len(suffix) for suffix in self._suffix_rules})
+        self._combined_rule_re = re.compile(
+            ''.join(rf'(?=(?:[\s\S]*?(?P<{group}>{rule.pattern}))?)' for _, group, rule in self._rule_groups),
+            re.IGNORECASE
+        )
+    
+    def _compile_dependency_closure(self):
+        """
+        Flatten dependency_graph into per-agent inheritance orders.
+        
+        For each agent, lists (dependency, direct_dependency, decay) in the
+        depth-first order the dependency chain is consulted, so the first
+        dependency that routes an interface decides what the agent inherits.
+        Only the first visit of each dependency is kept, since a later visit
+        cannot route where an earlier one did not. Leaf agents get an empty order.
+        """
+        self._inheritance_order: Dict[str, List[Tuple[str, str, float]]] = {}
+        
+        for agent_type in self.dependency_graph:
+            order: List[Tuple[str, str, float]] = []
+            # Every agent on the current path was marked seen when it was
+            # visited, so one set covers both cycles and repeat visits
+            # without carrying a path per stack entry
+            seen: Set[str] = {agent_type}
+            # Stack of (agent, direct dependency it was reached through, decay)
+            stack = [
+                (dep_agent, dep_agent, 0.7)
+                for dep_agent in reversed(self.dependency_graph[agent_type])
+            ]
+            while stack:
+                dep_agent, via_agent, decay = stack.pop()
+                if dep_agent in seen:
+                    continue  # Cyclic, or already consulted with its whole chain
+                seen.add(dep_agent)
+                order.append((dep_agent, via_agent, decay))
+                stack.extend(
+                    (next_agent, via_agent, decay * 0.7)
+                    for next_agent in reversed(self.dependency_graph.get(dep_agent, []))
+                )
+            self._inheritance_order[agent_type] = order
+    
+    def _matching_rules(self, interface_name: str) -> List[RoutingRule]:
+        """Return rules matching interface_name, in rule priority order."""
+        lowered = interface_name.lower()
+        matched = [
+            entry
+            for length in self._suffix_lengths
+            for entry in self._suffix_rules.get(lowered[-length:], ())
+        ]
+        
+        match = self._combined_rule_re.match(interface_name)
+        matched.extend((i, rule) for i, group, rule in self._rule_groups if match.group(group) is not None)
+        
+        matched.sort(key=lambda entry: entry[0])
+        return [rule for _, rule in matched]
+    
     def get_interfaces_for_agent(
         self,
         agent_type: str,
@@ -126,9 +304,17 @@ class AutoInterfaceRouter:
         Returns:
             Filtered interfaces for this agent
         """
+        agent_type = sys.intern(agent_type)
         relevant_interfaces = {}
+        self._refresh_indexes()
+        
+        # Shared interfaces are added wholesale below, so skip routing them
+        skip = self.shared_interfaces if include_shared else ()
         
         for interface_name, interface_def in all_interfaces.items():
+            if interface_name in skip:
+                continue
+            
             # Check if should be routed to this agent
             should_route, confidence, source = self._should_route_to_agent(
                 interface_name,
@@ -141,9 +327,11 @@ class AutoInterfaceRouter:
         
         # Add shared interfaces if requested
         if include_shared:
-            for interface_name in self.shared_interfaces:
-                if interface_name in all_interfaces:
-                    relevant_interfaces[interface_name] = all_interfaces[interface_name]
+            relevant_interfaces.update(
+                (interface_name, all_interfaces[interface_name])
+                for interface_name in self.shared_interfaces
+                if interface_name in all_interfaces
+            )
         
         return relevant_interfaces
     
@@ -156,49 +344,129 @@ class AutoInterfaceRouter:
         """
         Determine if interface should route to agent.
         
+        Results are memoized (LRU) until routing inputs change.
+        
         Returns:
             (should_route: bool, confidence: float, source: str)
         """
-        # 1. Check explicit mappings (highest priority)
-        if interface_name in self.explicit_mappings:
-            if agent_type in self.explicit_mappings[interface_name]:
-                return True, 1.0, 'explicit'
-        
-        # 2. Check learned mappings
-        if interface_name in self.learned_mappings:
-            if agent_type in self.learned_mappings[interface_name]:
-                usage_count = self.learned_mappings[interface_name][agent_type]
-                total_usage = sum(self.learned_mappings[interface_name].values())
-                confidence = usage_count / total_usage if total_usage > 0 else 0
-                
-                if confidence > 0.3:  # At least 30% of usage
-                    return True, confidence, 'learned'
-        
-        # 3. Check pattern-based rules
-        for rule in self.routing_rules:
-            if rule.matches(interface_name):
-                if agent_type in rule.agents:
-                    return True, rule.confidence, 'pattern'
-        
-        # 4. Check content-based classification
-        content_confidence = self._classify_by_content(interface_def, agent_type)
-        if content_confidence > 0.5:
-            return True, content_confidence, 'content'
-        
-        # 5. Check dependency chain
-        # If agent depends on another agent, inherit that agent's interfaces
-        dependencies = self.dependency_graph.get(agent_type, [])
-        for dep_agent in dependencies:
-            dep_should_route, dep_confidence, dep_source = self._should_route_to_agent(
-                interface_name,
-                interface_def,
-                dep_agent
+        key = (interface_name, interface_def)
+        cache = self._classification_cache
+        decisions = cache.get(key)
+        if decisions is None:
+            # Classify for every agent at once; the other agents' results are
+            # cached too, since callers usually query several agents in turn.
+            decisions = cache[key] = self._classify_all_agents(
+                interface_name, interface_def, agent_type
             )
-            if dep_should_route:
-                # Inherit with reduced confidence
-                return True, dep_confidence * 0.7, f'inherited_from_{dep_agent}'
+            if len(cache) > self._CLASSIFICATION_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+            if agent_type not in decisions:
+                # Agent outside the known set: classify and remember it as well
+                decisions[agent_type] = self._classify_all_agents(
+                    interface_name, interface_def, agent_type
+                )[agent_type]
+        return decisions[agent_type]
+    
+    def _classify_all_agents(
+        self,
+        interface_name: str,
+        interface_def: str,
+        *extra_agents: str
+    ) -> Dict[str, Tuple[bool, float, str]]:
+        """
+        Compute routing decisions for all known agents in a single pass.
+        
+        Name rules, explicit and learned mappings are looked up once per
+        interface, and each agent's direct (non-inherited) decision is computed
+        at most once. Dependency inheritance walks the precomputed flattened
+        dependency order instead of recursing.
         
-        return False, 0.0, 'unmatched'
+        Returns:
+            {agent_type: (should_route, confidence, source)}
+        """
+        explicit_agents = self.explicit_mappings.get(interface_name, ())
+        usage = self.learned_mappings.get(interface_name, {})
+        total_usage = self._learned_totals.get(interface_name, 0)
+        matched_rules = self._matching_rules(interface_name)
+        
+        direct: Dict[str, Optional[Tuple[float, str]]] = {}
+        content_scores: Optional[Dict[str, float]] = None
+        
+        def direct_decision(agent_type: str) -> Optional[Tuple[float, str]]:
+            nonlocal content_scores
+            if agent_type in direct:
+                return direct[agent_type]
+            
+            result = None
+            
+            # 1. Check explicit mappings (highest priority)
+            if agent_type in explicit_agents:
+                result = (1.0, 'explicit')
+            
+            # 2. Check learned mappings
+            if result is None and agent_type in usage:
+                confidence = usage[agent_type] / total_usage if total_usage > 0 else 0
+                if confidence > 0.3:  # At least 30% of usage
+                    result = (confidence, 'learned')
+            
+            # 3. Check pattern-based rules
+            if result is None:
+                for rule in matched_rules:
+                    if agent_type in rule.agents:
+                        result = (rule.confidence, 'pattern')
+                        break
+            
+            # 4. Check content-based classification
+            if result is None:
+                if content_scores is None:
+                    content_scores = self._content_scores(interface_def)
+                content_confidence = content_scores.get(agent_type, 0.0)
+                if content_confidence > 0.5:
+                    result = (content_confidence, 'content')
+            
+            direct[agent_type] = result
+            return result
+        
+        decisions: Dict[str, Tuple[bool, float, str]] = {}
+        
+        for agent_type in (*_AGENTS, *extra_agents):
+            result = direct_decision(agent_type)
+            if result is not None:
+                decisions[agent_type] = (True, *result)
+                continue
+            
+            # 5. Check dependency chain
+            # If agent depends on another agent, inherit that agent's interfaces
+            # (reduced by 0.7 per level, attributed to the direct dependency)
+            decisions[agent_type] = (False, 0.0, 'unmatched')
+            for dep_agent, via_agent, decay in self._inheritance_order.get(agent_type, ()):
+                result = direct_decision(dep_agent)
+                if result is not None:
+                    decisions[agent_type] = (True, result[0] * decay, f'inherited_from_{via_agent}')
+                    break
+        
+        return decisions
+    
+    def _content_scores(self, interface_def: str) -> Dict[str, float]:
+        """
+        Content confidence for every agent from one scan of the definition.
+        
+        Same scores as _classify_by_content per agent; agents without
+        keyword matches are omitted.
+        """
+        if self._all_keywords_re is None:
+            return {
+                agent_type: self._classify_by_content(interface_def, agent_type)
+                for agent_type in self._content_patterns
+            }
+        
+        counts: Counter = Counter()
+        for keyword in {match.lower() for match in self._all_keywords_re.findall(interface_def)}:
+            counts.update(self._keyword_agents.get(keyword, ()))
+        
+        return {agent_type: min(count / 3.0, 1.0) for agent_type, count in counts.items()}
     
     def _classify_by_content(self, interface_def: str, agent_type: str) -> float:
         """
@@ -207,15 +475,12 @@ class AutoInterfaceRouter:
         Returns:
             Confidence score (0-1)
         """
-        keywords = self.content_keywords.get(agent_type, [])
-        if not keywords:
+        pattern = self._content_patterns.get(agent_type)
+        if pattern is None:
             return 0.0
         
-        # Count keyword matches in interface definition
-        matches = 0
-        for keyword in keywords:
-            if re.search(rf'\b{keyword}\b', interface_def, re.IGNORECASE):
-                matches += 1
+        # Count distinct keywords matched in interface definition
+        matches = len({match.lower() for match in pattern.findall(interface_def)})
         
         # Calculate confidence based on match ratio
         confidence = min(matches / 3.0, 1.0)  # Cap at 1.0, 3+ matches = high confidence
@@ -235,13 +500,13 @@ class AutoInterfaceRouter:
             interface_name: Name of interface used
             increment: How many times it was used (default 1)
         """
-        if interface_name not in self.learned_mappings:
-            self.learned_mappings[interface_name] = {}
-        
-        if agent_type not in self.learned_mappings[interface_name]:
-            self.learned_mappings[interface_name][agent_type] = 0
-        
+        self._record_usage(sys.intern(agent_type), interface_name, increment)
+        self._classification_cache.clear()
+    
+    def _record_usage(self, agent_type: str, interface_name: str, increment: int):
+        """Update usage counters without invalidating the route cache."""
         self.learned_mappings[interface_name][agent_type] += increment
+        self._learned_totals[interface_name] += increment
     
     def learn_from_agent_outputs(self, agent_outputs: Dict[str, Dict]):
         """
@@ -250,11 +515,17 @@ class AutoInterfaceRouter:
         Args:
             agent_outputs: {agent_name: {interfaces: {...}}}
         """
+        learned = self.learned_mappings
         for agent_type, output in agent_outputs.items():
-            interfaces = output.get('interfaces', {})
+            agent_type = sys.intern(agent_type)
+            interface_names = list(output.get('interfaces', {}))
             
-            for interface_name in interfaces.keys():
-                self.learn_from_usage(agent_type, interface_name)
+            for interface_name in interface_names:
+                learned[interface_name][agent_type] += 1
+            # Totals: one C-level count over all names from this agent
+            self._learned_totals.update(interface_names)
+        
+        self._classification_cache.clear()
     
     def add_explicit_mapping(self, interface_name: str, agents: List[str]):
         """
@@ -264,7 +535,8 @@ class AutoInterfaceRouter:
             interface_name: Name of interface
             agents: List of agent types that should receive it
         """
-        self.explicit_mappings[interface_name] = agents
+        self.explicit_mappings[interface_name] = [sys.intern(agent) for agent in agents]
+        self._classification_cache.clear()
     
     def add_shared_interface(self, interface_name: str):
         """
@@ -274,6 +546,7 @@ class AutoInterfaceRouter:
             interface_name: Name of interface
         """
         self.shared_interfaces.add(interface_name)
+        self._classification_cache.clear()
     
     def validate_routing_completeness(
         self,
@@ -287,6 +560,7 @@ class AutoInterfaceRouter:
             List of warnings for unmapped interfaces with suggestions
         """
         warnings = []
+        self._refresh_indexes()
         
         for interface_name in interface_names:
             # Skip shared interfaces
@@ -295,19 +569,15 @@ class AutoInterfaceRouter:
             
             # Check if it routes to at least one agent
             interface_def = all_interfaces.get(interface_name, '')
-            routed_agents = []
+            decisions = self._classify_all_agents(interface_name, interface_def)
+            routed: List[Tuple[str, float, str]] = []
             
-            for agent_type in ['frontend', 'physics', 'state', 'testing', 'config', 'performance']:
-                should_route, confidence, source = self._should_route_to_agent(
-                    interface_name,
-                    interface_def,
-                    agent_type
-                )
-                
+            for agent_type in _AGENTS:
+                should_route, confidence, source = decisions[agent_type]
                 if should_route:
-                    routed_agents.append(f"{agent_type} ({confidence:.2f} via {source})")
+                    routed.append((agent_type, confidence, source))
             
-            if not routed_agents:
+            if not routed:
                 # Interface has no routing rules
                 suggestions = self._suggest_routing(interface_name, interface_def)
                 
@@ -319,13 +589,16 @@ class AutoInterfaceRouter:
                     'suggestions': suggestions,
                     'action': f"Add explicit mapping: router.add_explicit_mapping('{interface_name}', {suggestions})"
                 })
-            elif max(float(agent.split('(')[1].split(' ')[0]) for agent in routed_agents) < 0.7:
+            elif max(confidence for _, confidence, _ in routed) < 0.7:
                 # Low confidence routing
                 warnings.append({
                     'type': 'low_confidence_routing',
                     'severity': 'LOW',
                     'interface': interface_name,
-                    'routed_to': routed_agents,
+                    'routed_to': [
+                        f"{agent_type} ({confidence:.2f} via {source})"
+                        for agent_type, confidence, source in routed
+                    ],
                     'message': f"Interface '{interface_name}' has low confidence routing",
                     'action': "Consider adding explicit mapping for clarity"
                 })
@@ -339,28 +612,18 @@ class AutoInterfaceRouter:
         Returns:
             List of suggested agent types
         """
-        suggestions = []
-        
         # Analyze name patterns
-        if 'Props' in interface_name:
-            suggestions.append('frontend')
-        if any(x in interface_name for x in ['Store', 'State']):
-            suggestions.append('state')
-        if any(x in interface_name for x in ['Collision', 'Force', 'Physics', 'Rigid']):
-            suggestions.append('physics')
-        if 'Config' in interface_name:
-            suggestions.append('config')
-        if any(x in interface_name for x in ['Test', 'Mock']):
-            suggestions.append('testing')
+        suggestions = [
+            agent_type
+            for pattern, agent_type in self._NAME_TO_AGENTS
+            if pattern.search(interface_name)
+        ]
         
         # Analyze content if no name-based suggestions
         if not suggestions:
-            for agent_type, keywords in self.content_keywords.items():
-                for keyword in keywords:
-                    if re.search(rf'\b{keyword}\b', interface_def, re.IGNORECASE):
-                        if agent_type not in suggestions:
-                            suggestions.append(agent_type)
-                        break
+            for agent_type, pattern in self._content_patterns.items():
+                if pattern.search(interface_def):
+                    suggestions.append(agent_type)
         
         # Default to state if still no suggestions (data types often belong to state layer)
         if not suggestions:
@@ -378,23 +641,20 @@ class AutoInterfaceRouter:
         Returns:
             Formatted report string
         """
+        self._refresh_indexes()
         report = "📊 Interface Routing Report\n\n"
         
         # Group interfaces by agent
         agent_interfaces: Dict[str, List[Tuple[str, float, str]]] = {
-            agent: [] for agent in ['frontend', 'physics', 'state', 'testing', 'config', 'performance']
+            agent: [] for agent in _AGENTS
         }
         
         for interface_name, interface_def in all_interfaces.items():
-            for agent_type in agent_interfaces.keys():
-                should_route, confidence, source = self._should_route_to_agent(
-                    interface_name,
-                    interface_def,
-                    agent_type
-                )
-                
+            decisions = self._classify_all_agents(interface_name, interface_def)
+            for agent_type, interfaces in agent_interfaces.items():
+                should_route, confidence, source = decisions[agent_type]
                 if should_route:
-                    agent_interfaces[agent_type].append((interface_name, confidence, source))
+                    interfaces.append((interface_name, confidence, source))
         
         # Generate report
         for agent_type, interfaces in agent_interfaces.items():
@@ -414,7 +674,7 @@ class AutoInterfaceRouter:
         if self.learned_mappings:
             report += f"\n📚 LEARNED PATTERNS:\n"
             for interface_name, usage in self.learned_mappings.items():
-                total = sum(usage.values())
+                total = self._learned_totals[interface_name]
                 usage_str = ', '.join(f"{agent}: {count}/{total}" for agent, count in sorted(usage.items(), key=lambda x: -x[1]))
                 report += f"  • {interface_name}: {usage_str}\n"
         
@@ -430,14 +690,11 @@ class AutoInterfaceRouter:
         exported = {}
         
         for interface_name, usage in self.learned_mappings.items():
-            # Only export if we have high confidence (>50% usage by an agent)
-            total_usage = sum(usage.values())
+            # Only export if we have high confidence (>50% usage by an agent);
+            # running totals avoid re-summing, integer compare avoids division
+            total_usage = self._learned_totals[interface_name]
             
-            agents = []
-            for agent, count in usage.items():
-                confidence = count / total_usage if total_usage > 0 else 0
-                if confidence > 0.5:
-                    agents.append(agent)
+            agents = [agent for agent, count in usage.items() if 2 * count > total_usage > 0]
             
             if agents:
                 exported[interface_name] = agents
@@ -3,22 +3,64 @@ AgentContextHub: Maintains project state across distributed agents.
 Never stores full implementation details—only interfaces and contracts.
 """
 
-from typing import Dict, List, Optional, Any, Set, Tuple
+import re
+from collections import defaultdict, deque
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
 from .interface_routing import InterfaceRouter
 from .auto_router import AutoInterfaceRouter
-from .token_estimator import estimate_dict_tokens, estimate_tokens
+from .token_estimator import estimate_tokens
+from .dependency_graph import strongly_connected_components, cycle_through
+
+# Comment stripping for structural interface comparison: single-line and
+# block comments in one scan, whichever starts first
+_COMMENT_RE = re.compile(r'//[^\n]*|/\*.*?\*/', re.DOTALL)
+
+# One pass over the comment-free text: drop trailing commas before '}',
+# trim whitespace around punctuation, collapse remaining whitespace runs
+_NORMALIZE_COLLAPSE = re.compile(
+    r'(?P<comma>\s*,\s*(?=\}))|\s*(?P<punct>[{}()\[\]<>:,|&=?])\s*|\s+'
+)
+_SEMI_TABLE = str.maketrans('', '', ';')
+
+
+def _collapse_token(match: 're.Match[str]') -> str:
+    """Replacement for _NORMALIZE_COLLAPSE matches."""
+    if match.group('comma') is not None:
+        return ''
+    return match.group('punct') or ' '
+
+
+def _format_dep_key(source: str, target: str) -> str:
+    """Render a dependency key in the "source → target" format."""
+    return f"{source} → {target}"
+
+
+@lru_cache(maxsize=4096)
+def _parse_dep_key(dep_key: str) -> Optional[Tuple[str, str]]:
+    """
+    Parse a "source → target" dependency key into (source, target).
+    
+    Cached, since every dependency reader parses the same keys repeatedly.
+    Returns None for keys without an arrow.
+    """
+    source, sep, target = dep_key.partition('→')
+    if not sep:
+        return None
+    return source.strip(), target.strip()
 
 
 class AgentContextHub:
     def __init__(self):
         self.project_state = {
             'architecture': {},      # High-level decisions (e.g., "use Zustand for state")
-            'dependencies': {},      # Inter-agent dependencies (e.g., "physics → state")
+            'dependencies': {},      # Inter-agent dependencies (e.g., "physics → state": ["depends_on"])
             'completions': {},       # Finished tasks (e.g., "useHapticFeedback implemented")
             'interfaces': {},        # Contract definitions (TypeScript interfaces)
             'conflicts': []          # Detected inconsistencies
         }
-        self.agent_contexts = {}     # Per-agent context allocations
+        self.agent_contexts: Dict[str, deque] = defaultdict(deque)  # Per-agent context allocations
+        
         self.token_budgets = {       # Max tokens per agent type
             'orchestrator': 1000,
             'frontend': 2000,
@@ -41,50 +83,50 @@ class AgentContextHub:
         Register a new task with minimal context.
         Extract only dependencies, interfaces, and critical notes.
         """
+        task_dependencies = context.get('dependencies', [])
         allocation = {
             'task_name': task_name,
-            'dependencies': context.get('dependencies', []),
+            'dependencies': task_dependencies,
             'interfaces': context.get('interfaces', {}),
             'critical_notes': context.get('critical_notes', []),
             'test_requirements': context.get('test_requirements', []),
             'token_budget': self.token_budgets.get(agent_type, 1500)
         }
 
-        if agent_type not in self.agent_contexts:
-            self.agent_contexts[agent_type] = []
-
         self.agent_contexts[agent_type].append(allocation)
         
         # FIX: Persist dependencies to project_state (was missing!)
         # Dependencies should be stored as normalized relationships
-        task_dependencies = context.get('dependencies', [])
-        for dep in task_dependencies:
-            # Normalize dependency format: "source_agent → target_agent"
-            if isinstance(dep, dict):
-                # Handle dict format: {"from": "physics", "to": "state", "type": "updates"}
-                dep_key = f"{dep.get('from', agent_type)} → {dep.get('to', '')}"
-                dep_value = dep.get('type', 'depends_on')
-            elif isinstance(dep, str):
+        # ("source_agent → target_agent"). Split entries by type once so each
+        # group is normalized without per-item branching.
+        dict_deps = [dep for dep in task_dependencies if isinstance(dep, dict)]
+        str_deps = [dep for dep in task_dependencies if isinstance(dep, str)]
+        
+        # Handle dict format: {"from": "physics", "to": "state", "type": "updates"}
+        for dep in dict_deps:
+            self._store_dependency(
+                _format_dep_key(dep.get('from', agent_type), dep.get('to', '')),
+                dep.get('type', 'depends_on')
+            )
+        
+        for dep in str_deps:
+            if '→' in dep or '->' in dep:
                 # Handle string format: "physics → state"
-                if '→' in dep or '->' in dep:
-                    dep_key = dep.replace('->', '→')
-                    dep_value = 'depends_on'
-                else:
-                    # Assume it's a target agent name
-                    dep_key = f"{agent_type} → {dep}"
-                    dep_value = 'depends_on'
+                self._store_dependency(dep.replace('->', '→'), 'depends_on')
             else:
-                continue
-            
-            # Store dependency in project_state
-            if dep_key not in self.project_state['dependencies']:
-                self.project_state['dependencies'][dep_key] = []
-            
-            if dep_value not in self.project_state['dependencies'][dep_key]:
-                self.project_state['dependencies'][dep_key].append(dep_value)
+                # Assume it's a target agent name
+                self._store_dependency(_format_dep_key(agent_type, dep), 'depends_on')
         
         return allocation
 
+    def _store_dependency(self, dep_key: str, dep_value: str):
+        """Record one relationship type in project_state (types kept as a list)."""
+        types = self.project_state['dependencies'].setdefault(dep_key, [])
+        
+        # Type lists hold a handful of entries; a membership scan is cheapest
+        if dep_value not in types:
+            types.append(dep_value)
+
     def get_agent_context(self, agent_type: str) -> dict:
         """
         Return only the context allocated to this agent type.
@@ -92,7 +134,7 @@ class AgentContextHub:
         """
         return {
             'architecture': self.project_state['architecture'],
-            'tasks': self.agent_contexts.get(agent_type, []),
+            'tasks': list(self.agent_contexts.get(agent_type, ())),
             'interfaces': self._filter_interfaces(agent_type),
             'dependencies': self._get_dependencies(agent_type)
         }
@@ -104,6 +146,11 @@ class AgentContextHub:
         Uses auto-discovery routing by default for zero-maintenance operation.
         Falls back to explicit routing if configured.
         """
+        all_interfaces = self.project_state['interfaces']
+        if not all_interfaces:
+            # Nothing registered yet (cold start): every mode routes to {}
+            return {}
+        
         if self.routing_mode == 'auto':
             # Use auto-discovery router (learns from usage patterns)
             return self.auto_router.get_interfaces_for_agent(
@@ -164,10 +211,10 @@ class AgentContextHub:
         Returns:
             List of warnings with suggestions for unmapped interfaces
         """
-        interface_names = list(self.project_state['interfaces'].keys())
+        all_interfaces = self.project_state['interfaces']
         return self.auto_router.validate_routing_completeness(
-            interface_names,
-            self.project_state['interfaces']
+            tuple(all_interfaces),
+            all_interfaces
         )
     
     def export_learned_routing(self) -> Dict[str, List[str]]:
@@ -189,21 +236,21 @@ class AgentContextHub:
         
         relevant_deps = []
         for dep_key, dep_value in all_deps.items():
-            # Parse dependency key format: "source → target"
-            if '→' in dep_key:
-                source, target = dep_key.split('→')
-                source = source.strip()
-                target = target.strip()
-                
-                # Include if this agent is source or target
-                if source == agent_type or target == agent_type:
-                    relevant_deps.append({
-                        'key': dep_key,
-                        'source': source,
-                        'target': target,
-                        'types': dep_value,  # List of relationship types
-                        'direction': 'upstream' if target == agent_type else 'downstream'
-                    })
+            # Parse dependency key format: "source → target" (parse is cached)
+            parsed = _parse_dep_key(dep_key)
+            if not parsed:
+                continue
+            source, target = parsed
+            
+            # Include if this agent is source or target
+            if source == agent_type or target == agent_type:
+                relevant_deps.append({
+                    'key': dep_key,
+                    'source': source,
+                    'target': target,
+                    'types': dep_value,  # List of relationship types
+                    'direction': 'upstream' if target == agent_type else 'downstream'
+                })
         
         return relevant_deps
 
@@ -245,10 +292,9 @@ class AgentContextHub:
                 
                 if interface_name in interface_defs:
                     existing_def = interface_defs[interface_name]
-                    existing_normalized = self._normalize_interface(existing_def['definition'])
                     
                     # Structural comparison, not string equality
-                    if existing_normalized != normalized_def:
+                    if existing_def['normalized'] != normalized_def:
                         conflicts.append({
                             'type': 'interface_mismatch',
                             'severity': 'CRITICAL',
@@ -262,7 +308,8 @@ class AgentContextHub:
                 else:
                     interface_defs[interface_name] = {
                         'agent': agent,
-                        'definition': interface_def
+                        'definition': interface_def,
+                        'normalized': normalized_def
                     }
         
         # 2. Detect circular dependencies using graph analysis
@@ -276,81 +323,51 @@ class AgentContextHub:
         self.project_state['conflicts'] = conflicts
         return conflicts
     
-    def _normalize_interface(self, definition: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _normalize_interface(definition: str) -> str:
         """
         Normalize interface definition for structural comparison.
         Removes whitespace, comments, and formatting differences.
+        Cached, since the same definitions are compared on every detection run.
         """
-        import re
-        
-        # Remove single-line comments
-        no_comments = re.sub(r'//.*$', '', definition, flags=re.MULTILINE)
+        # Remove single-line and multi-line comments (every comment starts with '/')
+        no_comments = _COMMENT_RE.sub('', definition) if '/' in definition else definition
         
-        # Remove multi-line comments
-        no_comments = re.sub(r'/\*.*?\*/', '', no_comments, flags=re.DOTALL)
-        
-        # Normalize whitespace (collapse to single spaces)
-        normalized = ' '.join(no_comments.split())
-        
-        # Remove trailing semicolons and commas for comparison
-        normalized = normalized.replace(';', '').replace(',}', '}').replace(', }', '}')
+        # Remove semicolons, then trailing commas and whitespace in one pass
+        normalized = _NORMALIZE_COLLAPSE.sub(_collapse_token, no_comments.translate(_SEMI_TABLE))
         
         return normalized.strip()
     
     def _detect_circular_dependencies(self) -> List[Dict[str, Any]]:
         """
-        Detect circular dependencies using DFS cycle detection.
-        Returns list of conflicts representing circular dependency chains.
+        Detect circular dependencies using Tarjan's strongly connected components.
+        Returns one conflict per cycle group: every SCC with more than one agent,
+        or a single agent that depends on itself. The reported cycle is the
+        shortest dependency path from the group's lexicographically smallest
+        agent back to itself, so the same group always reports the same cycle.
         """
         conflicts = []
         
         # Build adjacency list from dependencies
-        graph: Dict[str, Set[str]] = {}
+        graph: Dict[str, List[str]] = {}
         for dep_key in self.project_state['dependencies'].keys():
-            if '→' in dep_key:
-                source, target = dep_key.split('→')
-                source = source.strip()
-                target = target.strip()
-                
-                if source not in graph:
-                    graph[source] = set()
-                graph[source].add(target)
+            parsed = _parse_dep_key(dep_key)
+            if parsed:
+                source, target = parsed
+                graph.setdefault(source, []).append(target)
         
-        # DFS to detect cycles
-        visited = set()
-        rec_stack = set()
-        
-        def dfs(node: str, path: List[str]) -> Optional[List[str]]:
-            """Returns cycle if found, None otherwise."""
-            visited.add(node)
-            rec_stack.add(node)
-            path.append(node)
-            
-            for neighbor in graph.get(node, []):
-                if neighbor not in visited:
-                    cycle = dfs(neighbor, path[:])
-                    if cycle:
-                        return cycle
-                elif neighbor in rec_stack:
-                    # Found cycle - extract it
-                    cycle_start = path.index(neighbor)
-                    return path[cycle_start:] + [neighbor]
-            
-            rec_stack.remove(node)
-            return None
-        
-        # Check all nodes
-        for node in graph.keys():
-            if node not in visited:
-                cycle = dfs(node, [])
-                if cycle:
-                    cycle_str = ' → '.join(cycle)
-                    conflicts.append({
-                        'type': 'circular_dependency',
-                        'severity': 'CRITICAL',
-                        'cycle': cycle,
-                        'message': f"Circular dependency detected: {cycle_str}"
-                    })
+        for component in strongly_connected_components(graph):
+            node = min(component)
+            if len(component) > 1 or node in graph.get(node, ()):
+                cycle = cycle_through(graph, component, node)
+                cycle_str = ' → '.join(cycle)
+                conflicts.append({
+                    'type': 'circular_dependency',
+                    'severity': 'CRITICAL',
+                    'cycle': cycle,
+                    'message': f"Circular dependency detected: {cycle_str}"
+                })
         
         return conflicts
     
@@ -363,10 +380,9 @@ class AgentContextHub:
         registered_agents = set(self.agent_contexts.keys())
         
         for dep_key in self.project_state['dependencies'].keys():
-            if '→' in dep_key:
-                source, target = dep_key.split('→')
-                source = source.strip()
-                target = target.strip()
+            parsed = _parse_dep_key(dep_key)
+            if parsed:
+                source, target = parsed
                 
                 # Check if both source and target are registered
                 if source and source not in registered_agents and source not in ['orchestrator']:
@@ -392,10 +408,8 @@ class AgentContextHub:
         Estimate token usage for an agent type using accurate token counting.
         Returns current usage, budget, and breakdown by field.
         """
-        context = self.get_agent_context(agent_type)
-        
         # Use improved token estimation
-        token_breakdown = estimate_dict_tokens(context)
+        token_breakdown = self.estimate_agent_context_tokens(agent_type)
         estimated_tokens = sum(token_breakdown.values())
         
         budget = self.token_budgets.get(agent_type, 1500)
@@ -410,12 +424,30 @@ class AgentContextHub:
             'breakdown': token_breakdown  # Show which fields use most tokens
         }
 
+    def estimate_agent_context_tokens(self, agent_type: str) -> Dict[str, int]:
+        """
+        Estimate tokens per field of get_agent_context(agent_type).
+        
+        Feeds each field straight to the estimator instead of building the
+        combined context dict first; the breakdown is identical.
+        """
+        fields = (
+            ('architecture', self.project_state['architecture']),
+            ('tasks', list(self.agent_contexts.get(agent_type, ()))),
+            ('interfaces', self._filter_interfaces(agent_type)),
+            ('dependencies', self._get_dependencies(agent_type))
+        )
+        return {
+            key: estimate_tokens(key) + estimate_tokens(value)
+            for key, value in fields
+        }
+
     def clear_agent_contexts(self, agent_type: Optional[str] = None):
         """
         Clear contexts for a specific agent or all agents.
         Useful for starting fresh on new tasks.
         """
         if agent_type:
-            self.agent_contexts[agent_type] = []
+            self.agent_contexts[agent_type].clear()
         else:
-            self.agent_contexts = {}
+            self.agent_contexts.clear()
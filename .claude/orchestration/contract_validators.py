@@ -7,12 +7,94 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional
 from collections import defaultdict
+from itertools import chain
 
 
-def extract_store_contracts(project_root: Path, agent_outputs: Dict[str, Dict]) -> Optional[Dict]:
+# File types the contract scanners read
+_TS_SUFFIXES = frozenset({'.ts', '.tsx'})
+
+# Store hook destructuring: const { prop1, prop2 } = useXXXStore()
+_STORE_HOOK_RE = re.compile(r'const\s*\{([^}]+)\}\s*=\s*use(\w+Store)\(\)')
+
+# Interface property names: propertyName: type or propertyName?: type
+_PROP_NAME_RE = re.compile(r'(\w+)\s*[?:]')
+
+# JSX attribute names: propName=
+_JSX_PROP_RE = re.compile(r'(\w+)=')
+
+# Every setState( call in one scan:
+# - store: receiver of store.setState(...) (store modifications)
+# - nonfunc: set when called with a direct object, setState({ ... }),
+#   instead of an updater, setState(state => ({ ... }))
+_SETSTATE_CALL_RE = re.compile(
+    r'(?:(?P<store>\w+)\.)?setState\((?=(?P<nonfunc>\s*\{[^}]+\}\s*\))?)'
+)
+
+
+def scan_agent_files(project_root: Path, agent_outputs: Dict[str, Dict]) -> Dict[Path, Dict]:
+    """
+    Read every TypeScript file touched by agent outputs once and run the
+    file-level contract patterns against it.
+    
+    The result can be passed to extract_store_contracts, validate_component_props
+    and detect_race_conditions so they share one read per file.
+    
+    Returns:
+        {
+            file_path: {
+                'content': file text,
+                'store_hooks': [(props_str, store_name)],
+                'store_setters': [store_var],
+                'non_functional_setstate': bool
+            }
+        }
+    """
+    scanned = {}
+    
+    for output in agent_outputs.values():
+        for file_path_str in chain(output.get('filesModified', ()), output.get('filesCreated', ())):
+            file_path = project_root / file_path_str
+            
+            if file_path in scanned or file_path.suffix not in _TS_SUFFIXES:
+                continue
+            
+            # Open directly instead of stat-then-open; missing files are skipped
+            try:
+                content = file_path.read_text()
+            except OSError:
+                continue
+            
+            store_setters = []
+            non_functional = False
+            # Literal pre-checks skip the regex walk on files that cannot match
+            setstate_calls = _SETSTATE_CALL_RE.finditer(content) if 'setState(' in content else ()
+            for match in setstate_calls:
+                if match.group('store'):
+                    store_setters.append(match.group('store'))
+                if match.group('nonfunc') is not None:
+                    non_functional = True
+            
+            scanned[file_path] = {
+                'content': content,
+                'store_hooks': _STORE_HOOK_RE.findall(content) if 'Store()' in content else [],
+                'store_setters': store_setters,
+                'non_functional_setstate': non_functional
+            }
+    
+    return scanned
+
+
+def extract_store_contracts(
+    project_root: Path,
+    agent_outputs: Dict[str, Dict],
+    scanned: Optional[Dict[Path, Dict]] = None
+) -> Optional[Dict]:
     """
     Extract store definitions and usages from agent outputs.
     
+    Args:
+        scanned: Result of scan_agent_files (scanned here if not given)
+    
     Returns:
         {
             'definitions': {store_name: interface_definition},
@@ -29,20 +111,18 @@ def extract_store_contracts(project_root: Path, agent_outputs: Dict[str, Dict])
             if interface_name.endswith('Store') or interface_name.endswith('State'):
                 definitions[interface_name] = interface_def
     
+    if scanned is None:
+        scanned = scan_agent_files(project_root, agent_outputs)
+    
     # Extract store usages from modified files
     for output in agent_outputs.values():
-        for file_path_str in output.get('filesModified', []) + output.get('filesCreated', []):
+        for file_path_str in chain(output.get('filesModified', ()), output.get('filesCreated', ())):
             file_path = project_root / file_path_str
+            scan = scanned.get(file_path)
             
-            if file_path.exists() and file_path.suffix in ['.ts', '.tsx']:
-                content = file_path.read_text()
-                
-                # Find store hook calls: const { prop1, prop2 } = useXXXStore()
-                # Using raw string to avoid escape issues
-                store_pattern = r'const\s*\{([^}]+)\}\s*=\s*use(\w+Store)\(\)'
-                matches = re.findall(store_pattern, content)
-                
-                for props_str, store_name in matches:
+            if scan is not None:
+                # Store hook calls: const { prop1, prop2 } = useXXXStore()
+                for props_str, store_name in scan['store_hooks']:
                     # Parse property names
                     props = [p.strip().split(':')[0].strip() for p in props_str.split(',')]
                     
@@ -56,10 +136,17 @@ def extract_store_contracts(project_root: Path, agent_outputs: Dict[str, Dict])
     return {'definitions': definitions, 'usages': usages}
 
 
-def validate_component_props(project_root: Path, agent_outputs: Dict[str, Dict]) -> List[str]:
+def validate_component_props(
+    project_root: Path,
+    agent_outputs: Dict[str, Dict],
+    scanned: Optional[Dict[Path, Dict]] = None
+) -> List[str]:
     """
     Validate that component prop usages match interface definitions.
     
+    Args:
+        scanned: Result of scan_agent_files (scanned here if not given)
+    
     Returns:
         List of conflicts for mismatched props
     """
@@ -73,32 +160,41 @@ def validate_component_props(project_root: Path, agent_outputs: Dict[str, Dict])
             if interface_name.endswith('Props'):
                 # Extract property names from interface definition
                 # Matches: propertyName: type or propertyName?: type
-                props = set(re.findall(r'(\w+)\s*[?:]', interface_def))
+                props = frozenset(_PROP_NAME_RE.findall(interface_def))
+                component_name = interface_name.replace('Props', '')
                 component_interfaces[interface_name] = {
+                    'component': component_name,
+                    'tag': f'<{component_name}',
+                    # Simplified pattern - full JSX parsing would be more robust
+                    'pattern': re.compile(f'<{component_name}[\\s\\n]+([^/>]*)/>', re.MULTILINE),
                     'props': props,
                     'definition': interface_def
                 }
     
+    if scanned is None:
+        scanned = scan_agent_files(project_root, agent_outputs)
+    
     # Find JSX usages and validate props
     for output in agent_outputs.values():
-        for file_path_str in output.get('filesModified', []) + output.get('filesCreated', []):
+        for file_path_str in chain(output.get('filesModified', ()), output.get('filesCreated', ())):
             file_path = project_root / file_path_str
+            scan = scanned.get(file_path)
             
-            if file_path.exists() and file_path.suffix in ['.tsx']:
-                content = file_path.read_text()
+            if scan is not None and file_path.suffix == '.tsx':
+                content = scan['content']
                 
                 # Check each component interface
                 for interface_name, interface_data in component_interfaces.items():
-                    component_name = interface_name.replace('Props', '')
+                    component_name = interface_data['component']
                     
                     # Find usages of this component
-                    # Simplified pattern - full JSX parsing would be more robust
-                    component_pattern = f'<{component_name}[\\s\\n]+([^/>]*)/>'
-                    matches = re.findall(component_pattern, content, re.MULTILINE)
+                    if interface_data['tag'] not in content:
+                        continue
+                    matches = interface_data['pattern'].findall(content)
                     
                     for props_str in matches:
                         # Extract prop names used
-                        used_props = set(re.findall(r'(\w+)=', props_str))
+                        used_props = set(_JSX_PROP_RE.findall(props_str))
                         
                         # Check for undefined props
                         undefined_props = used_props - interface_data['props']
@@ -113,7 +209,11 @@ def validate_component_props(project_root: Path, agent_outputs: Dict[str, Dict])
     return conflicts
 
 
-def detect_race_conditions(project_root: Path, agent_outputs: Dict[str, Dict]) -> List[str]:
+def detect_race_conditions(
+    project_root: Path,
+    agent_outputs: Dict[str, Dict],
+    scanned: Optional[Dict[Path, Dict]] = None
+) -> List[str]:
     """
     Detect potential race conditions from concurrent state updates.
     
@@ -122,44 +222,47 @@ def detect_race_conditions(project_root: Path, agent_outputs: Dict[str, Dict]) -
     - Async state updates without proper synchronization
     - Event handlers that don't use functional updates
     
+    Args:
+        scanned: Result of scan_agent_files (scanned here if not given)
+    
     Returns:
         List of warnings for potential race conditions
     """
     warnings = []
     
-    # Track which stores are modified by which agents
+    # Track which stores are modified by which agents (and where)
     store_modifiers = defaultdict(list)
+    store_agents = defaultdict(set)
+    
+    if scanned is None:
+        scanned = scan_agent_files(project_root, agent_outputs)
     
     for agent, output in agent_outputs.items():
-        for file_path_str in output.get('filesModified', []) + output.get('filesCreated', []):
+        for file_path_str in chain(output.get('filesModified', ()), output.get('filesCreated', ())):
             file_path = project_root / file_path_str
+            scan = scanned.get(file_path)
             
-            if file_path.exists() and file_path.suffix in ['.ts', '.tsx']:
-                content = file_path.read_text()
-                
-                # Find store modifications: store.setState(...)
-                store_set_pattern = r'(\w+)\.setState\('
-                matches = re.findall(store_set_pattern, content)
-                
-                for store_var in matches:
+            if scan is not None:
+                # Store modifications: store.setState(...)
+                for store_var in scan['store_setters']:
                     store_modifiers[store_var].append({
                         'agent': agent,
                         'file': file_path.name
                     })
+                    store_agents[store_var].add(agent)
                 
                 # Check for non-functional setState calls (potential race condition)
-                # setState({ ... }) instead of setState(state => ({ ... }))
-                non_functional_pattern = r'setState\(\s*\{[^}]+\}\s*\)'
-                if re.search(non_functional_pattern, content):
+                if scan['non_functional_setstate']:
                     warnings.append(
                         f"⚠️  MEDIUM: Potential race condition in {file_path.name}\n"
                         f"  Non-functional setState found (direct object instead of updater function)\n"
                         f"  Consider: setState(state => {{ ...state, newValue }})"
                     )
     
-    # Check for stores modified by multiple agents
+    # Check for stores modified by multiple agents (one agent touching a
+    # store from several files is not a cross-agent race)
     for store, modifiers in store_modifiers.items():
-        if len(modifiers) > 1:
+        if len(store_agents[store]) > 1:
             agent_list = ', '.join(f"{m['agent']} ({m['file']})" for m in modifiers)
             warnings.append(
                 f"⚠️  HIGH: Store '{store}' modified by multiple agents: {agent_list}\n"
@@ -0,0 +1,85 @@
+"""
+Dependency graph helpers shared by the context hub and the integration validator.
+"""
+
+from collections import deque
+from typing import Any, Dict, List, Set
+
+
+def strongly_connected_components(graph: Dict[Any, List[Any]]) -> List[List[Any]]:
+    """
+    Iterative Tarjan SCC over an adjacency list (nodes can be any hashable).
+    
+    Nodes that only appear as targets are treated as having no edges.
+    Each component lists its nodes in DFS discovery order.
+    """
+    index: Dict[Any, int] = {}
+    lowlink: Dict[Any, int] = {}
+    on_stack: Set[Any] = set()
+    stack: List[Any] = []
+    components: List[List[Any]] = []
+    
+    for root in graph:
+        if root in index:
+            continue
+        
+        index[root] = lowlink[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(graph.get(root, ())))]
+        
+        while work:
+            node, neighbors = work[-1]
+            for neighbor in neighbors:
+                if neighbor not in index:
+                    index[neighbor] = lowlink[neighbor] = len(index)
+                    stack.append(neighbor)
+                    on_stack.add(neighbor)
+                    work.append((neighbor, iter(graph.get(neighbor, ()))))
+                    break
+                if neighbor in on_stack:
+                    lowlink[node] = min(lowlink[node], index[neighbor])
+            else:
+                # All neighbors visited: close out this node
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    component.reverse()
+                    components.append(component)
+    
+    return components
+
+
+def cycle_through(graph: Dict[Any, List[Any]], component: List[Any], start: Any) -> List[Any]:
+    """
+    Shortest dependency cycle from start back to itself within one SCC.
+    
+    Breadth-first over edges between the component's nodes, so every step
+    of the returned path is a real edge; closed on start.
+    """
+    members = set(component)
+    parent: Dict[Any, Any] = {start: None}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        for neighbor in graph.get(node, ()):
+            if neighbor == start:
+                path = [node]
+                while parent[path[-1]] is not None:
+                    path.append(parent[path[-1]])
+                path.reverse()
+                path.append(start)
+                return path
+            if neighbor in members and neighbor not in parent:
+                parent[neighbor] = node
+                queue.append(neighbor)
+    return [start]
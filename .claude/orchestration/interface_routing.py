@@ -3,7 +3,93 @@ Explicit task→interface routing configuration.
 Replaces keyword-based heuristics with deterministic mappings.
 """
 
-from typing import Dict, List, Set
+import sys
+from collections import defaultdict
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Set, Tuple
+
+
+# Default explicit interface→agent mappings, built once at import
+_DEFAULT_ROUTING: Dict[str, frozenset] = {
+    # Frontend Agent: UI components, panels, layouts
+    'frontend': frozenset({
+        'DiceProps',
+        'CustomDiceProps', 
+        'DiceIconProps',
+        'PanelProps',
+        'ToolbarProps',
+        'BottomNavProps',
+        'SettingsPanelProps',
+        'ArtistTestingPanelProps',
+        'ThemeSelectorProps',
+        'SavedRollsPanelProps',
+        'InventoryPanelProps',
+    }),
+    
+    # Physics Agent: Rapier, collision, rigid bodies
+    'physics': frozenset({
+        'DiceInstance',
+        'RigidBodyHandle',
+        'ColliderType',
+        'ForceConfig',
+        'ImpulseVector',
+        'VelocityThreshold',
+        'CollisionEvent',
+        'ContactForceEvent',
+    }),
+    
+    # State Agent: Zustand stores, state management
+    'state': frozenset({
+        'UIStore',
+        'InventoryState',
+        'DiceManagerState', 
+        'SavedRollsState',
+        'ThemeState',
+        'InventoryDie',
+        'DiceInstance',
+        'SavedRoll',
+        'CustomDiceAsset',
+    }),
+    
+    # Testing Agent: Test utilities, mocks
+    'testing': frozenset({
+        'TestSetup',
+        'MockRigidBody',
+        'MockHaptics',
+        'TestFixture',
+    }),
+    
+    # Config Agent: Configuration types
+    'config': frozenset({
+        'PhysicsConfig',
+        'ThemeConfig',
+        'StarterDiceConfig',
+        'ValidationConfig',
+    }),
+    
+    # Performance Agent: Optimization types
+    'performance': frozenset({
+        'PerformanceMetrics',
+        'FPSMonitor',
+        'MemoizationConfig',
+    }),
+}
+
+# Shared interfaces accessible by all agents
+_DEFAULT_SHARED: frozenset = frozenset({
+    'DiceType',  # Core type used everywhere
+    'DiceMetadata',  # Shared across state, frontend, physics
+})
+
+# Dependency mappings: agent → (agents it depends on)
+_DEFAULT_DEPENDENCIES: Dict[str, Tuple[str, ...]] = {
+    'frontend': ('state', 'physics'),  # UI consumes state & physics
+    'physics': ('state',),  # Physics updates state
+    'testing': ('frontend', 'state', 'physics'),  # Tests all layers
+    'config': (),  # No dependencies (base layer)
+    'state': (),  # No dependencies (base layer)
+    'performance': ('frontend', 'state', 'physics'),  # Optimizes all layers
+}
 
 
 class InterfaceRouter:
@@ -15,103 +101,117 @@ class InterfaceRouter:
     - Complete: Can route interfaces with non-obvious names (DiceProps, CustomDiceAsset)
     - Maintainable: Clear single source of truth for routing rules
     - Extensible: Easy to add new agents or interface mappings
+    
+    routing_config, shared_interfaces and dependency_graph are read-only
+    views (frozensets and tuples instead of lists), because routing is
+    precomputed from them. Change routing through add_interface_mapping and
+    add_shared_interface.
     """
     
+    __slots__ = (
+        '_routing_config',
+        '_shared_interfaces',
+        '_dependency_graph',
+        'interface_to_agents',
+        '_agent_closure',
+        '_agent_closure_noshared',
+        '_dependents',
+        '_shared_closure',
+        '_all_agents',
+        '_dep_chain_cache',
+    )
+    
+    # Shared read-only defaults for dict lookups (no per-call allocation)
+    _EMPTY_TUPLE: tuple = ()
+    _EMPTY_SET: frozenset = frozenset()
+    
     def __init__(self):
-        # Explicit interface→agent mappings
-        self.routing_config: Dict[str, List[str]] = {
-            # Frontend Agent: UI components, panels, layouts
-            'frontend': [
-                'DiceProps',
-                'CustomDiceProps', 
-                'DiceIconProps',
-                'PanelProps',
-                'ToolbarProps',
-                'BottomNavProps',
-                'SettingsPanelProps',
-                'ArtistTestingPanelProps',
-                'ThemeSelectorProps',
-                'SavedRollsPanelProps',
-                'InventoryPanelProps',
-            ],
-            
-            # Physics Agent: Rapier, collision, rigid bodies
-            'physics': [
-                'DiceInstance',
-                'RigidBodyHandle',
-                'ColliderType',
-                'ForceConfig',
-                'ImpulseVector',
-                'VelocityThreshold',
-                'CollisionEvent',
-                'ContactForceEvent',
-            ],
-            
-            # State Agent: Zustand stores, state management
-            'state': [
-                'UIStore',
-                'InventoryState',
-                'DiceManagerState', 
-                'SavedRollsState',
-                'ThemeState',
-                'InventoryDie',
-                'DiceInstance',
-                'SavedRoll',
-                'CustomDiceAsset',
-            ],
-            
-            # Testing Agent: Test utilities, mocks
-            'testing': [
-                'TestSetup',
-                'MockRigidBody',
-                'MockHaptics',
-                'TestFixture',
-            ],
-            
-            # Config Agent: Configuration types
-            'config': [
-                'PhysicsConfig',
-                'ThemeConfig',
-                'StarterDiceConfig',
-                'ValidationConfig',
-            ],
-            
-            # Performance Agent: Optimization types
-            'performance': [
-                'PerformanceMetrics',
-                'FPSMonitor',
-                'MemoizationConfig',
-            ],
-        }
+        # Explicit interface→agent mappings (frozensets for O(1) membership;
+        # add_interface_mapping swaps in a new set)
+        self._routing_config: Dict[str, FrozenSet[str]] = dict(_DEFAULT_ROUTING)
         
         # Shared interfaces accessible by all agents
-        self.shared_interfaces: List[str] = [
-            'DiceType',  # Core type used everywhere
-            'DiceMetadata',  # Shared across state, frontend, physics
-        ]
-        
-        # Dependency mappings: agent → [agents it depends on]
-        self.dependency_graph: Dict[str, List[str]] = {
-            'frontend': ['state', 'physics'],  # UI consumes state & physics
-            'physics': ['state'],  # Physics updates state
-            'testing': ['frontend', 'state', 'physics'],  # Tests all layers
-            'config': [],  # No dependencies (base layer)
-            'state': [],  # No dependencies (base layer)
-            'performance': ['frontend', 'state', 'physics'],  # Optimizes all layers
-        }
+        self._shared_interfaces: FrozenSet[str] = _DEFAULT_SHARED
+        
+        # Dependency mappings: agent → (agents it depends on)
+        self._dependency_graph: Dict[str, Tuple[str, ...]] = dict(_DEFAULT_DEPENDENCIES)
         
         # Build reverse lookup: interface → agents
         self._build_reverse_lookup()
+        
+        # Precompute routed interface names per agent
+        self._rebuild_closures()
+        
+        # get_dependency_chain results, precomputed for every configured agent
+        self._dep_chain_cache: Dict[str, Tuple[str, ...]] = {
+            agent_type: self._build_dep_chain(agent_type)
+            for agent_type in self._dependency_graph
+        }
+    
+    @property
+    def routing_config(self) -> Mapping[str, FrozenSet[str]]:
+        """Explicit interface→agent mappings (read-only view)."""
+        return MappingProxyType(self._routing_config)
+    
+    @property
+    def shared_interfaces(self) -> FrozenSet[str]:
+        """Interfaces routed to every agent (read-only)."""
+        return self._shared_interfaces
+    
+    @property
+    def dependency_graph(self) -> Mapping[str, Tuple[str, ...]]:
+        """Agent → agents it depends on (read-only view)."""
+        return MappingProxyType(self._dependency_graph)
     
     def _build_reverse_lookup(self):
         """Build interface_name → [agent_types] mapping."""
-        self.interface_to_agents: Dict[str, Set[str]] = {}
+        interface_to_agents = defaultdict(set)
         
-        for agent, interfaces in self.routing_config.items():
+        for agent, interfaces in self._routing_config.items():
             for interface in interfaces:
-                if interface not in self.interface_to_agents:
-                    self.interface_to_agents[interface] = set()
-                self.interface_to_agents[interface].add(agent)
+                interface_to_agents[interface].add(agent)
+        
+        # Plain dict so lookups of unknown names don't insert entries
+        self.interface_to_agents: Dict[str, Set[str]] = dict(interface_to_agents)
+    
+    def _rebuild_closures(self):
+        """
+        Precompute each agent's routed interface names: its own interfaces,
+        shared ones, and its direct dependencies'.
+        
+        Stored with and without shared interfaces so lookups don't branch.
+        """
+        self._agent_closure: Dict[str, frozenset] = {}
+        self._agent_closure_noshared: Dict[str, frozenset] = {}
+        
+        # Reverse dependency index: agent → agents that directly depend on it
+        # Closures only pull in direct dependencies, so direct dependents are
+        # exactly the agents to refresh when an agent's own routing changes
+        dependents = defaultdict(set)
+        for agent_type, deps in self._dependency_graph.items():
+            for dep_agent in deps:
+                dependents[dep_agent].add(agent_type)
+        self._dependents: Dict[str, frozenset] = {
+            agent_type: frozenset(agents) for agent_type, agents in dependents.items()
+        }
+        
+        for agent_type in self._routing_config.keys() | self._dependency_graph.keys():
+            self._rebuild_closure(agent_type)
+        
+        # Agents with no routing or dependencies still receive shared interfaces
+        self._shared_closure = frozenset(self._shared_interfaces)
+        
+        # Every configured agent, returned for shared interfaces
+        self._all_agents = frozenset(self._routing_config)
+    
+    def _rebuild_closure(self, agent_type: str):
+        """Recompute one agent's routed interface names."""
+        names = set(self._routing_config.get(agent_type, self._EMPTY_TUPLE))
+        for dep_agent in self._dependency_graph.get(agent_type, self._EMPTY_TUPLE):
+            names.update(self._routing_config.get(dep_agent, self._EMPTY_TUPLE))
+        
+        self._agent_closure_noshared[agent_type] = frozenset(names)
+        self._agent_closure[agent_type] = frozenset(names | self._shared_interfaces)
     
     def get_interfaces_for_agent(
         self, 
@@ -130,31 +230,55 @@ class InterfaceRouter:
         Returns:
             Filtered interfaces for this agent
         """
-        relevant_interfaces = {}
+        # Own + shared (if requested) + direct dependencies' interfaces,
+        # precomputed by _rebuild_closures
+        if include_shared:
+            names = self._agent_closure.get(agent_type, self._shared_closure)
+        else:
+            names = self._agent_closure_noshared.get(agent_type, self._EMPTY_SET)
         
-        # Get explicitly routed interfaces
-        routed_interface_names = self.routing_config.get(agent_type, [])
+        # C-level intersection (sorted so the result order is deterministic),
+        # then build the dict in C without per-item bytecode
+        present = sorted(all_interfaces.keys() & names)
+        return dict(zip(present, map(all_interfaces.__getitem__, present)))
+    
+    def get_interfaces_for_all_agents(
+        self,
+        all_interfaces: Dict[str, str],
+        include_shared: bool = True
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Get interfaces for every configured agent in one pass over all_interfaces.
         
-        for interface_name in routed_interface_names:
-            if interface_name in all_interfaces:
-                relevant_interfaces[interface_name] = all_interfaces[interface_name]
+        Equivalent to calling get_interfaces_for_agent for each agent, but each
+        interface is routed once via the reverse lookup and dependents index.
         
-        # Add shared interfaces if requested
-        if include_shared:
-            for interface_name in self.shared_interfaces:
-                if interface_name in all_interfaces:
-                    relevant_interfaces[interface_name] = all_interfaces[interface_name]
+        Args:
+            all_interfaces: All available interfaces {name: definition}
+            include_shared: Whether to include shared interfaces
         
-        # Add interfaces from dependency chain
-        # If agent depends on another agent, include that agent's interfaces
-        dependencies = self.dependency_graph.get(agent_type, [])
-        for dep_agent in dependencies:
-            dep_interfaces = self.routing_config.get(dep_agent, [])
-            for interface_name in dep_interfaces:
-                if interface_name in all_interfaces:
-                    relevant_interfaces[interface_name] = all_interfaces[interface_name]
+        Returns:
+            {agent_type: filtered interfaces}
+        """
+        closures = self._agent_closure if include_shared else self._agent_closure_noshared
+        result: Dict[str, Dict[str, str]] = {agent_type: {} for agent_type in closures}
         
-        return relevant_interfaces
+        for interface_name in sorted(all_interfaces):
+            if include_shared and interface_name in self._shared_interfaces:
+                receivers = closures.keys()
+            else:
+                owners = self.interface_to_agents.get(interface_name, self._EMPTY_SET)
+                if not owners:
+                    continue
+                receivers = owners.union(
+                    *(self._dependents.get(agent, self._EMPTY_SET) for agent in owners)
+                )
+            
+            interface_def = all_interfaces[interface_name]
+            for agent_type in receivers:
+                result[agent_type][interface_name] = interface_def
+        
+        return result
     
     def get_agents_for_interface(self, interface_name: str) -> Set[str]:
         """
@@ -164,14 +288,14 @@ class InterfaceRouter:
             interface_name: Name of interface
         
         Returns:
-            Set of agent types that need this interface
+            Set of agent types that need this interface (shared; do not mutate)
         """
         # Check if it's a shared interface
-        if interface_name in self.shared_interfaces:
-            return set(self.routing_config.keys())
+        if interface_name in self._shared_interfaces:
+            return self._all_agents
         
         # Return agents from reverse lookup
-        return self.interface_to_agents.get(interface_name, set())
+        return self.interface_to_agents.get(interface_name, self._EMPTY_SET)
     
     def validate_routing_completeness(self, interface_names: List[str]) -> List[str]:
         """
@@ -183,14 +307,11 @@ class InterfaceRouter:
         Returns:
             List of interfaces without routing rules
         """
-        unrouted = []
-        
-        for interface_name in interface_names:
-            if interface_name not in self.shared_interfaces:
-                if interface_name not in self.interface_to_agents:
-                    unrouted.append(interface_name)
-        
-        return unrouted
+        # Set difference in C, then one pass to keep input order
+        unrouted_set = set(interface_names) - self._shared_interfaces - self.interface_to_agents.keys()
+        if not unrouted_set:
+            return []
+        return [name for name in interface_names if name in unrouted_set]
     
     def get_dependency_chain(self, agent_type: str) -> List[str]:
         """
@@ -202,21 +323,30 @@ class InterfaceRouter:
         Returns:
             Ordered list of dependencies (topologically sorted)
         """
-        visited = set()
+        cached = self._dep_chain_cache.get(agent_type)
+        if cached is None:
+            cached = self._dep_chain_cache[agent_type] = self._build_dep_chain(agent_type)
+        return list(cached)
+    
+    def _build_dep_chain(self, agent_type: str) -> Tuple[str, ...]:
+        """Iterative post-order DFS from agent_type (dependencies before dependents)."""
+        visited = {agent_type}
         chain = []
+        stack = [(agent_type, iter(self._dependency_graph.get(agent_type, self._EMPTY_TUPLE)))]
         
-        def dfs(agent: str):
-            if agent in visited:
-                return
-            visited.add(agent)
-            
-            for dep in self.dependency_graph.get(agent, []):
-                dfs(dep)
-            
-            chain.append(agent)
+        while stack:
+            agent, deps = stack[-1]
+            for dep in deps:
+                if dep not in visited:
+                    visited.add(dep)
+                    stack.append((dep, iter(self._dependency_graph.get(dep, self._EMPTY_TUPLE))))
+                    break
+            else:
+                stack.pop()
+                chain.append(agent)
         
-        dfs(agent_type)
-        return chain[:-1]  # Exclude self
+        chain.pop()  # Exclude self (always finished last)
+        return tuple(chain)
     
     def add_interface_mapping(self, interface_name: str, agent_types: List[str]):
         """
@@ -226,15 +356,27 @@ class InterfaceRouter:
             interface_name: Name of interface
             agent_types: Agent types that should receive this interface
         """
-        for agent_type in agent_types:
-            if agent_type not in self.routing_config:
-                self.routing_config[agent_type] = []
+        # Intern runtime names so routing dict lookups hit the identity fast path
+        interface_name = sys.intern(interface_name)
+        changed = set()
+        for agent_type in map(sys.intern, agent_types):
+            if agent_type not in self._routing_config:
+                self._routing_config[agent_type] = frozenset()
+                self._all_agents = self._all_agents | {agent_type}
+            routed = self._routing_config[agent_type]
             
-            if interface_name not in self.routing_config[agent_type]:
-                self.routing_config[agent_type].append(interface_name)
+            if interface_name not in routed:
+                self._routing_config[agent_type] = routed | {interface_name}
+                changed.add(agent_type)
         
-        # Rebuild reverse lookup
-        self._build_reverse_lookup()
+        # Patch the reverse lookup and the routed names of the changed agents
+        # and their direct dependents, instead of rebuilding everything
+        for agent_type in changed:
+            self.interface_to_agents.setdefault(interface_name, set()).add(agent_type)
+        
+        dependents = (self._dependents.get(agent, self._EMPTY_TUPLE) for agent in changed)
+        for agent_type in changed.union(*dependents):
+            self._rebuild_closure(agent_type)
     
     def add_shared_interface(self, interface_name: str):
         """
@@ -243,5 +385,13 @@ class InterfaceRouter:
         Args:
             interface_name: Name of interface
         """
-        if interface_name not in self.shared_interfaces:
-            self.shared_interfaces.append(interface_name)
+        interface_name = sys.intern(interface_name)
+        if interface_name not in self._shared_interfaces:
+            self._shared_interfaces = self._shared_interfaces | {interface_name}
+            
+            # Shared names only affect the with-shared closures; patch those
+            # instead of recomputing every agent's dependency unions
+            added = frozenset((interface_name,))
+            for agent_type, names in self._agent_closure.items():
+                self._agent_closure[agent_type] = names | added
+            self._shared_closure = self._shared_closure | added
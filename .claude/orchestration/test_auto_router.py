@@ -65,6 +65,25 @@ class TestPatternMatching:
         assert 'PhysicsConfig' in config_interfaces
         assert 'ValidationConfig' in config_interfaces
 
+    def test_combined_rule_index_matches_each_rule(self):
+        """Test that the combined rule regex reports every overlapping rule in order."""
+        router = AutoInterfaceRouter()
+
+        for name in ['CollisionEvent', 'DiceProps', 'RigidBodyHandle', 'MockStore', 'Unmatched']:
+            expected = [rule for rule in router.routing_rules if rule.matches(name)]
+            assert router._matching_rules(name) == expected
+
+    def test_rules_added_after_construction_take_effect(self):
+        """Test that editing routing_rules directly is picked up by routing."""
+        router = AutoInterfaceRouter()
+        interfaces = {'DiceWidget': 'interface DiceWidget { id: string }'}
+
+        assert 'DiceWidget' not in router.get_interfaces_for_agent('config', interfaces)
+
+        router.routing_rules.append(RoutingRule(r'Widget$', ['config'], 0.9, 'pattern'))
+
+        assert 'DiceWidget' in router.get_interfaces_for_agent('config', interfaces)
+
 
 class TestContentBasedClassification:
     """Test content-based interface classification."""
@@ -105,6 +124,27 @@ class TestContentBasedClassification:
         # Should route based on 'rigidBody', 'rapier', 'velocity' keywords
         assert 'MyPhysicsType' in physics_interfaces
 
+    def test_repeated_keyword_counts_once(self):
+        """Test that content confidence counts distinct keywords, not occurrences."""
+        router = AutoInterfaceRouter()
+
+        repeated = 'interface X { config: Config; Config2: config; CONFIG: string }'
+        distinct = 'interface X { config: string; settings: string; options: string }'
+
+        assert abs(router._classify_by_content(repeated, 'config') - 1 / 3) < 0.01
+        assert router._classify_by_content(distinct, 'config') == 1.0
+
+    def test_edited_content_keywords_take_effect(self):
+        """Test that keywords added in place after construction are used."""
+        router = AutoInterfaceRouter()
+        interfaces = {'Widget': 'interface Widget { foo: string; bar: string; baz: string }'}
+
+        assert 'Widget' not in router.get_interfaces_for_agent('config', interfaces)
+
+        router.content_keywords['config'].extend(['foo', 'bar', 'baz'])
+
+        assert 'Widget' in router.get_interfaces_for_agent('config', interfaces)
+
 
 class TestLearningFromUsage:
     """Test learning interface routing from actual usage."""
@@ -163,9 +203,36 @@ class TestLearningFromUsage:
         
         # Should now route to frontend based on learned pattern
         frontend_interfaces = router.get_interfaces_for_agent('frontend', interfaces, include_shared=False)
-        
+
         assert 'UnknownType' in frontend_interfaces
 
+    def test_learning_invalidates_cached_routing(self):
+        """Test that routing decisions made before learning are not reused after."""
+        router = AutoInterfaceRouter()
+
+        interfaces = {
+            'UnknownType': 'interface UnknownType { ... }'
+        }
+
+        assert 'UnknownType' not in router.get_interfaces_for_agent('config', interfaces, include_shared=False)
+
+        router.learn_from_usage('config', 'UnknownType')
+
+        assert 'UnknownType' in router.get_interfaces_for_agent('config', interfaces, include_shared=False)
+
+    def test_classification_cache_is_bounded(self):
+        """Test that memoized routing decisions are evicted beyond the cache size."""
+        router = AutoInterfaceRouter()
+        router._CLASSIFICATION_CACHE_SIZE = 2
+
+        interfaces = {f'Type{i}': f'interface Type{i} {{ id: string }}' for i in range(5)}
+        router.get_interfaces_for_agent('config', interfaces)
+
+        assert list(router._classification_cache) == [
+            ('Type3', interfaces['Type3']),
+            ('Type4', interfaces['Type4'])
+        ]
+
 
 class TestExplicitMappings:
     """Test explicit mappings override auto-discovery."""
@@ -242,6 +309,17 @@ class TestDependencyChainInheritance:
         # Should be available (inherited from dependency)
         assert 'StateOnlyInterface' in frontend_interfaces
 
+    def test_edited_dependency_graph_takes_effect(self):
+        """Test that dependencies added in place after construction are inherited."""
+        router = AutoInterfaceRouter()
+        interfaces = {'DiceProps': 'interface DiceProps { id: string }'}
+
+        assert 'DiceProps' not in router.get_interfaces_for_agent('config', interfaces)
+
+        router.dependency_graph['config'].append('frontend')
+
+        assert 'DiceProps' in router.get_interfaces_for_agent('config', interfaces)
+
 
 class TestRoutingValidation:
     """Test routing completeness validation."""
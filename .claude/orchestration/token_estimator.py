@@ -5,8 +5,118 @@ Provides accurate token counting for orchestration context.
 Falls back to character-based estimation if tiktoken not available.
 """
 
+from functools import lru_cache
 from typing import Any, Dict
 import json
+import threading
+
+# Faster JSON serialization for large dicts if available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Loaded tiktoken encodings by model name, shared across estimators
+_TOKENIZER_CACHE: Dict[str, Any] = {}
+_TOKENIZER_LOCK = threading.Lock()
+
+
+# Texts longer than this bypass the token-count cache to bound its memory
+_CACHE_MAX_CHARS = 8192
+
+
+# Short plain ASCII text (field keys like "type", "from") is estimated from
+# its length alone; structural characters keep code on the accurate path
+_SHORT_TEXT_CHARS = 64
+_STRUCTURAL_CHARS = '{}[]<>'
+
+
+# Characters the fallback estimate counts as (likely separate) punctuation tokens
+_PUNCT_CHARS = '.,;:!?()[]{}'
+
+
+def _fallback_token_count(text: str) -> int:
+    """
+    Improved character-based token estimation.
+    
+    Better than naive len(text) // 4 because it accounts for:
+    - Whitespace (doesn't consume many tokens)
+    - Punctuation (sometimes separate tokens)
+    - Code structure (braces, operators)
+    """
+    # Base character count
+    char_count = len(text)
+    
+    # Count different character types; both counts run in C. Whitespace
+    # isn't counted separately since the formula only uses words
+    word_count = len(text.split())
+    punct_count = sum(map(text.count, _PUNCT_CHARS))
+    
+    # Estimation formula (calibrated to GPT tokenizer behavior):
+    # - Each word is roughly 1.3 tokens on average
+    # - Whitespace is negligible (already counted in words)
+    # - Punctuation adds ~0.5 tokens each
+    # - Remaining characters are ~4 chars per token
+    
+    word_tokens = word_count * 1.3
+    punct_tokens = punct_count * 0.5
+    
+    # Use the maximum of word-based or character-based estimate
+    # This handles both natural language and code well
+    char_based = char_count / 4.0
+    word_based = word_tokens + punct_tokens
+    
+    return int(max(char_based, word_based))
+
+
+def _is_short_text(text: str) -> bool:
+    """Whether text takes the length-only fast path."""
+    return (
+        0 < len(text) < _SHORT_TEXT_CHARS
+        and text.isascii()
+        and not any(c in text for c in _STRUCTURAL_CHARS)
+    )
+
+
+def _short_text_tokens(text: str) -> int:
+    """Length-only estimate for short plain ASCII text (~4 chars per token)."""
+    return max(1, len(text) // 4)
+
+
+def _count_tokens(tokenizer: Any, text: str) -> int:
+    """Token count with tiktoken if available, else the fallback estimate."""
+    if tokenizer is not None:
+        # Ordinary encoding: special-token text such as "<|endoftext|>"
+        # is counted rather than rejected
+        return len(tokenizer.encode_ordinary(text))
+    return _fallback_token_count(text)
+
+
+def _dumps_compact(value: Any) -> str:
+    """Compact JSON text, via orjson when it's installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode()
+        except TypeError:
+            # Non-string keys, big ints, sets etc. - use the stdlib encoder
+            pass
+    return json.dumps(value, separators=(',', ':'))
+
+
+def _stringify(value: Any) -> str:
+    """Text that gets tokenized for a value."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list)):
+        # Use compact JSON representation
+        return _dumps_compact(value)
+    return str(value)
+
+
+# Module-level so the cache doesn't hold estimator instances; keyed by
+# tokenizer as well, since estimators for different models may coexist
+_cached_count_tokens = lru_cache(maxsize=4096)(_count_tokens)
 
 
 class TokenEstimator:
@@ -30,10 +140,19 @@ class TokenEstimator:
         # Try to import tiktoken
         try:
             import tiktoken
-            self.tokenizer = tiktoken.get_encoding(model)
         except ImportError:
             # tiktoken not available - will use fallback estimation
-            pass
+            return
+        
+        # Loading an encoding parses its BPE table, so every estimator
+        # for the same model shares one
+        tokenizer = _TOKENIZER_CACHE.get(model)
+        if tokenizer is None:
+            with _TOKENIZER_LOCK:
+                tokenizer = _TOKENIZER_CACHE.get(model)
+                if tokenizer is None:
+                    tokenizer = _TOKENIZER_CACHE[model] = tiktoken.get_encoding(model)
+        self.tokenizer = tokenizer
     
     def estimate_tokens(self, value: Any) -> int:
         """
@@ -45,21 +164,17 @@ class TokenEstimator:
         Returns:
             Estimated token count
         """
-        # Convert value to string representation
-        if isinstance(value, str):
-            text = value
-        elif isinstance(value, (dict, list)):
-            # Use compact JSON representation
-            text = json.dumps(value, separators=(',', ':'))
-        else:
-            text = str(value)
+        text = _stringify(value)
         
-        # Use tiktoken if available
-        if self.tokenizer:
-            return len(self.tokenizer.encode(text))
+        # Tiny values cost more to tokenize than they contribute
+        if _is_short_text(text):
+            return _short_text_tokens(text)
         
-        # Otherwise use improved character-based estimation
-        return self._fallback_estimate(text)
+        # Orchestration sends the same strings through repeatedly (interfaces
+        # reach every dependent agent), so counts for short texts are cached
+        if len(text) > _CACHE_MAX_CHARS:
+            return _count_tokens(self.tokenizer, text)
+        return _cached_count_tokens(self.tokenizer, text)
     
     def _fallback_estimate(self, text: str) -> int:
         """
@@ -76,29 +191,7 @@ class TokenEstimator:
         Returns:
             Estimated token count
         """
-        # Base character count
-        char_count = len(text)
-        
-        # Count different character types
-        whitespace_count = sum(1 for c in text if c.isspace())
-        punct_count = sum(1 for c in text if c in '.,;:!?()[]{}')
-        word_count = len(text.split())
-        
-        # Estimation formula (calibrated to GPT tokenizer behavior):
-        # - Each word is roughly 1.3 tokens on average
-        # - Whitespace is negligible (already counted in words)
-        # - Punctuation adds ~0.5 tokens each
-        # - Remaining characters are ~4 chars per token
-        
-        word_tokens = word_count * 1.3
-        punct_tokens = punct_count * 0.5
-        
-        # Use the maximum of word-based or character-based estimate
-        # This handles both natural language and code well
-        char_based = char_count / 4.0
-        word_based = word_tokens + punct_tokens
-        
-        return int(max(char_based, word_based))
+        return _fallback_token_count(text)
     
     def estimate_dict_tokens(self, data: Dict[str, Any]) -> Dict[str, int]:
         """
@@ -132,9 +225,9 @@ class TokenEstimator:
             Total estimated token count
         """
         if isinstance(data, dict):
-            # Sum tokens for all fields
-            breakdown = self.estimate_dict_tokens(data)
-            return sum(breakdown.values())
+            # Sum tokens for all fields without building the breakdown
+            estimate = self.estimate_tokens
+            return sum(estimate(key) + estimate(value) for key, value in data.items())
         else:
             # Direct estimation
             return self.estimate_tokens(data)
@@ -142,13 +235,16 @@ class TokenEstimator:
 
 # Global estimator instance
 _estimator = None
+_estimator_lock = threading.Lock()
 
 
 def get_estimator() -> TokenEstimator:
     """Get or create global token estimator instance."""
     global _estimator
     if _estimator is None:
-        _estimator = TokenEstimator()
+        with _estimator_lock:
+            if _estimator is None:
+                _estimator = TokenEstimator()
     return _estimator
 
 
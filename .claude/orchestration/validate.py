@@ -3,26 +3,103 @@ Integration validation layer.
 Runs cross-agent contract checks before deployment.
 """
 
+import os
 import re
+import json
 import ast
 from pathlib import Path
-from typing import List, Dict, Set, Tuple, Optional
-from collections import defaultdict
+from typing import List, Dict, Tuple, Optional
+from itertools import chain
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
+from .dependency_graph import strongly_connected_components, cycle_through
 from .contract_validators import (
+    scan_agent_files,
     extract_store_contracts,
     validate_component_props,
     detect_race_conditions
 )
 
 
+# ES import statements: import ... from 'specifier'
+_IMPORT_RE = re.compile(r"import .* from ['\"](.+)['\"]")
+
+# Unindented lines that start top-level code; imports are only read up to
+# the first one, so large modules aren't loaded whole
+_CODE_START = (
+    'const ', 'let ', 'var ', 'function ', 'async function ', 'class ',
+    'abstract class ', 'interface ', 'type ', 'enum ', 'declare ',
+    'export default ', 'export const ', 'export let ', 'export var ',
+    'export function ', 'export async ', 'export class ', 'export abstract ',
+    'export interface ', 'export type ', 'export enum ', 'export declare '
+)
+
+# Comment stripping for interface comparison
+_COMMENT_LINE_RE = re.compile(r'//.*$', re.MULTILINE)
+_COMMENT_BLOCK_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+
+# Import resolution candidates: the path itself or with an extension,
+# then index files when the import names a directory
+_IMPORT_EXTENSIONS = ('', '.ts', '.tsx', '.js', '.jsx')
+_INDEX_FILES = ('index.ts', 'index.tsx', 'index.js', 'index.jsx')
+
+# Below this many files, thread pool startup costs more than it overlaps
+_PARALLEL_SCAN_MIN_FILES = 16
+
+# Files that need tests, and the sibling test file names that count
+_CODE_SUFFIXES = frozenset({'.ts', '.tsx', '.js', '.jsx'})
+_TEST_EXTENSIONS = ('.test.ts', '.test.tsx', '.test.js', '.test.jsx')
+
+# Store interface property: "propertyName: type"
+_STORE_PROPERTY_RE = re.compile(r'(\w+):\s*\w+')
+
+
+
+def _read_import_prelude(file_path: Path) -> List[str]:
+    """
+    Import specifiers from the leading part of a file, read line by line up
+    to the first top-level code statement (imports must precede code).
+    
+    Re-exports (export ... from '...') don't end the prelude. The import
+    pattern never spans lines, so matching per line finds the same imports
+    as matching the whole prelude.
+    """
+    imports = []
+    with file_path.open() as lines:
+        for line in lines:
+            if line.startswith(_CODE_START) and not (line.startswith('export ') and ' from ' in line):
+                break
+            # Substring pre-check: most lines can't match, skip the regex call
+            if 'import ' in line:
+                imports.extend(_IMPORT_RE.findall(line))
+    return imports
+
+
 class IntegrationValidator:
     """Validates contracts across agent outputs."""
 
-    def __init__(self, project_root: Path):
+    def __init__(self, project_root: Path, cache_path: Optional[Path] = None):
+        """
+        Args:
+            project_root: Root the agent output paths are relative to
+            cache_path: Optional JSON file that persists parsed imports
+                between validator instances (e.g. repeated CLI runs)
+        """
         self.project_root = Path(project_root)
+        self.cache_path = Path(cache_path) if cache_path is not None else None
         self.conflicts = []
         self.warnings = []
+        # Per-run report inputs, set by run_all_validations
+        self._type_conflicts: List[str] = []
+        self._dependency_conflicts: List[str] = []
+        self._severity_counts: Counter = Counter()
+        # Run-scoped caches, only set while run_all_validations is running:
+        # directory -> (file names, subdirectory names), and file path ->
+        # (mtime_ns, size, import specifiers) loaded from cache_path
+        self._dir_cache: Optional[Dict[str, Tuple[frozenset, frozenset]]] = None
+        self._imports_cache: Optional[Dict[Path, Tuple[int, int, List[str]]]] = None
 
     def validate_type_safety(self, agent_interfaces: Dict[str, Dict[str, str]]) -> List[str]:
         """
@@ -36,18 +113,21 @@ class IntegrationValidator:
         """
         conflicts = []
 
-        # Group interfaces by name across all agents
+        # Group raw interface definitions by name across all agents
         interface_map = defaultdict(dict)
         for agent, interfaces in agent_interfaces.items():
             for interface_name, definition in interfaces.items():
-                interface_map[interface_name][agent] = self._normalize_interface(definition)
+                interface_map[interface_name][agent] = definition
 
         # Check for conflicts
-        for interface_name, agent_defs in interface_map.items():
-            if len(agent_defs) > 1:
-                # Multiple agents define this interface
-                unique_defs = set(agent_defs.values())
-                if len(unique_defs) > 1:
+        for interface_name, raw_defs in interface_map.items():
+            if len(raw_defs) > 1:
+                # Multiple agents define this interface: only now is
+                # normalization needed, for the comparison
+                agent_defs = {agent: self._normalize_interface(defn) for agent, defn in raw_defs.items()}
+                normalized = iter(agent_defs.values())
+                first_def = next(normalized)
+                if any(defn != first_def for defn in normalized):
                     # Definitions don't match
                     conflict = f"❌ CRITICAL: Interface '{interface_name}' has conflicting definitions:"
                     for agent, defn in agent_defs.items():
@@ -56,167 +136,244 @@ class IntegrationValidator:
 
         return conflicts
 
-    def _normalize_interface(self, definition: str) -> str:
-        """Normalize interface definition for comparison (remove whitespace, comments)."""
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _normalize_interface(definition: str) -> str:
+        """
+        Normalize interface definition for comparison (remove whitespace, comments).
+        Cached, since agents often share the same definitions.
+        """
         # Remove comments
-        no_comments = re.sub(r'//.*$', '', definition, flags=re.MULTILINE)
-        no_comments = re.sub(r'/\*.*?\*/', '', no_comments, flags=re.DOTALL)
+        no_comments = _COMMENT_LINE_RE.sub('', definition)
+        no_comments = _COMMENT_BLOCK_RE.sub('', no_comments)
 
         # Normalize whitespace
         normalized = ' '.join(no_comments.split())
 
         return normalized
 
-    def validate_imports(self, file_path: Path) -> List[str]:
+    def validate_imports(
+        self,
+        file_path: Path,
+        scanned: Optional[Dict[Path, Optional[List]]] = None
+    ) -> List[str]:
         """
         Check for circular dependencies and unresolved imports.
         Now supports index.ts/tsx resolution and TypeScript path aliases.
 
         Args:
             file_path: Path to file to validate
+            scanned: Result of _scan_imports per file (scanned here if not given)
 
         Returns:
             List of conflicts found
         """
         conflicts = []
 
-        if not file_path.exists():
+        # Read file, extract and resolve imports
+        if scanned is not None and file_path in scanned:
+            records = scanned[file_path]
+        else:
+            records = self._scan_imports(file_path)
+        if records is None:
             return [f"❌ File not found: {file_path}"]
 
-        # Read file and extract imports
-        content = file_path.read_text()
-        imports = re.findall(r"import .* from ['\"](.+)['\"]", content)
-
         # Check if imports resolve
+        for imp, target in records:
+            if target is None:
+                if imp.startswith('.'):
+                    conflicts.append(f"❌ HIGH: Unresolved import in {file_path.name}: {imp}")
+                else:
+                    conflicts.append(f"❌ HIGH: Unresolved path alias in {file_path.name}: {imp}")
+
+        return conflicts
+
+    def _scan_imports(self, file_path: Path) -> Optional[List[Tuple[str, Optional[Path]]]]:
+        """
+        Relative and @/ alias imports in a file with the file each resolves to
+        (None if unresolved), or None if the file doesn't exist.
+        
+        Shared by validate_imports and detect_circular_dependencies so each
+        file is parsed and resolved once per validation run.
+        """
+        imports = self._file_imports(file_path)
+        if imports is None:
+            return None
+
+        file_dir = str(file_path.parent)
+        root_dir = str(self.project_root)
+        records = []
         for imp in imports:
+            # Imports are resolved lexically (normpath), without resolve()'s
+            # per-component symlink lookups
             if imp.startswith('.'):
                 # Relative import - resolve relative to file
-                resolved = (file_path.parent / imp).resolve()
-
-                # Try common extensions AND index files
-                extensions = ['', '.ts', '.tsx', '.js', '.jsx']
-                index_files = ['/index.ts', '/index.tsx', '/index.js', '/index.jsx']
-                
-                found = False
-                
-                # Try direct file with extensions
-                for ext in extensions:
-                    candidate = resolved.parent / (resolved.name + ext)
-                    if candidate.exists():
-                        found = True
-                        break
-                
-                # Try index files if import points to directory
-                if not found and resolved.is_dir():
-                    for index_file in index_files:
-                        candidate = Path(str(resolved) + index_file)
-                        if candidate.exists():
-                            found = True
-                            break
-                
-                # Try index files by treating import as directory
-                if not found:
-                    for index_file in index_files:
-                        candidate = Path(str(resolved) + index_file)
-                        if candidate.exists():
-                            found = True
-                            break
-
-                if not found:
-                    conflicts.append(f"❌ HIGH: Unresolved import in {file_path.name}: {imp}")
-            
+                resolved = os.path.normpath(os.path.join(file_dir, imp))
             elif imp.startswith('@/'):
-                # TypeScript path alias - check if it resolves
+                # TypeScript path alias
                 # Assume @/ maps to src/
-                alias_path = imp.replace('@/', 'src/')
-                resolved = self.project_root / alias_path
-                
-                # Try common extensions AND index files
-                extensions = ['', '.ts', '.tsx', '.js', '.jsx']
-                index_files = ['/index.ts', '/index.tsx', '/index.js', '/index.jsx']
-                
-                found = False
-                
-                # Try direct file
-                for ext in extensions:
-                    candidate = resolved.parent / (resolved.name + ext)
-                    if candidate.exists():
-                        found = True
-                        break
-                
-                # Try index files
-                if not found:
-                    for index_file in index_files:
-                        candidate = Path(str(resolved) + index_file)
-                        if candidate.exists():
-                            found = True
-                            break
-                
-                if not found:
-                    conflicts.append(f"❌ HIGH: Unresolved path alias in {file_path.name}: {imp}")
+                resolved = os.path.normpath(os.path.join(root_dir, imp.replace('@/', 'src/')))
+            else:
+                continue
+            records.append((imp, self._resolve_import(resolved)))
 
-        return conflicts
+        return records
 
-    def detect_circular_dependencies(self, file_paths: List[Path]) -> List[str]:
+    def _file_imports(self, file_path: Path) -> Optional[List[str]]:
+        """
+        Import specifiers in a file, or None if the file doesn't exist.
+        
+        With a cache_path, imports persisted by earlier runs are reused while
+        the file's mtime and size are unchanged.
+        """
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        
+        if self._imports_cache is None:
+            return _read_import_prelude(file_path)
+        
+        cached = self._imports_cache.get(file_path)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+        
+        imports = _read_import_prelude(file_path)
+        self._imports_cache[file_path] = (stat.st_mtime_ns, stat.st_size, imports)
+        return imports
+
+    def _load_imports_cache(self) -> Dict[Path, Tuple[int, int, List[str]]]:
+        """Parsed imports persisted by an earlier run, if any."""
+        cache = {}
+        try:
+            data = json.loads(self.cache_path.read_text())
+            for path_str, (mtime, size, imports) in data.items():
+                cache[Path(path_str)] = (mtime, size, imports)
+        except (OSError, ValueError, TypeError, AttributeError):
+            # Missing or unreadable cache - imports are parsed from scratch
+            cache.clear()
+        return cache
+
+    def _save_imports_cache(self, cache: Dict[Path, Tuple[int, int, List[str]]]):
+        """Persist parsed imports for the next run (best effort), minus deleted files."""
+        data = {
+            str(path): [mtime, size, imports]
+            for path, (mtime, size, imports) in cache.items()
+            if path.exists()
+        }
+        try:
+            self.cache_path.write_text(json.dumps(data))
+        except OSError:
+            pass
+
+    def _resolve_import(self, resolved: str) -> Optional[Path]:
+        """
+        File an import target resolves to: the path itself or with a common
+        extension, else an index file when it names a directory. None if
+        nothing matches.
+        
+        Candidates are looked up in directory listings rather than stat'ed
+        one by one. A directory without an index file still resolves (to the
+        directory itself), since the bare path exists.
+        """
+        parent, name = os.path.split(resolved)
+        
+        # Try direct file with extensions, then index files
+        sibling_files, sibling_dirs = self._dir_listing(parent or os.curdir)
+        for ext in _IMPORT_EXTENSIONS:
+            if name + ext in sibling_files:
+                return Path(parent, name + ext)
+        
+        if name in sibling_dirs:
+            index_files = self._dir_listing(resolved)[0]
+            for index_file in _INDEX_FILES:
+                if index_file in index_files:
+                    return Path(resolved, index_file)
+            return Path(resolved)
+        
+        return None
+
+    def _dir_listing(self, directory: str) -> Tuple[frozenset, frozenset]:
+        """
+        Names of the files and of the subdirectories in a directory (both
+        empty if it doesn't exist).
+        
+        During run_all_validations each directory is listed once; outside a
+        run every lookup lists the directory afresh.
+        """
+        if self._dir_cache is not None:
+            cached = self._dir_cache.get(directory)
+            if cached is not None:
+                return cached
+        
+        files, dirs = set(), set()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        dirs.add(entry.name)
+                    else:
+                        files.add(entry.name)
+        except OSError:
+            pass
+        listing = (frozenset(files), frozenset(dirs))
+        
+        if self._dir_cache is not None:
+            self._dir_cache[directory] = listing
+        return listing
+
+    def detect_circular_dependencies(
+        self,
+        file_paths: List[Path],
+        scanned: Optional[Dict[Path, Optional[List]]] = None
+    ) -> List[str]:
         """
-        Detect circular dependencies using DFS.
+        Detect circular dependencies using Tarjan's strongly connected components.
+        Each cycle group is reported once, as the shortest import path from its
+        first-discovered file back to itself.
 
         Args:
             file_paths: List of files to check
+            scanned: Result of _scan_imports per file (scanned here if not given)
 
         Returns:
             List of circular dependency chains
         """
         conflicts = []
 
-        # Build dependency graph
-        graph = {}
-        for file_path in file_paths:
-            if not file_path.exists():
-                continue
-
-            content = file_path.read_text()
-            imports = re.findall(r"import .* from ['\"](.+)['\"]", content)
+        # Build dependency graph from resolved relative imports. Files get
+        # integer ids so the SCC pass hashes ints rather than Paths
+        node_ids: Dict[Path, int] = {}
+        nodes: List[Path] = []
 
-            # Resolve imports to absolute paths
-            resolved_imports = []
-            for imp in imports:
-                if imp.startswith('.'):
-                    resolved = (file_path.parent / imp).resolve()
-                    # Try common extensions
-                    for ext in ['', '.ts', '.tsx']:
-                        candidate = resolved.parent / (resolved.name + ext)
-                        if candidate.exists():
-                            resolved_imports.append(candidate)
-                            break
-
-            graph[file_path] = resolved_imports
-
-        # DFS to detect cycles
-        def dfs(node: Path, visited: Set[Path], path: List[Path]) -> Optional[List[Path]]:
-            if node in path:
-                # Cycle detected
-                cycle_start = path.index(node)
-                return path[cycle_start:] + [node]
-
-            if node in visited:
-                return None
-
-            visited.add(node)
-            path.append(node)
-
-            for neighbor in graph.get(node, []):
-                cycle = dfs(neighbor, visited, path[:])
-                if cycle:
-                    return cycle
+        def node_id(path: Path) -> int:
+            index = node_ids.get(path)
+            if index is None:
+                index = node_ids[path] = len(nodes)
+                nodes.append(path)
+            return index
 
-            return None
+        graph: Dict[int, List[int]] = {}
+        for file_path in file_paths:
+            if scanned is not None and file_path in scanned:
+                records = scanned[file_path]
+            else:
+                records = self._scan_imports(file_path)
+            if records is None:
+                continue
 
-        visited = set()
-        for start_node in graph:
-            cycle = dfs(start_node, visited, [])
-            if cycle:
-                cycle_str = " → ".join(p.name for p in cycle)
+            graph[node_id(file_path)] = [
+                node_id(target) for imp, target in records
+                if target is not None and imp.startswith('.')
+            ]
+
+        # One linear Tarjan pass finds every cycle group: any SCC with more
+        # than one file, or a file that imports itself
+        for component in strongly_connected_components(graph):
+            node = component[0]
+            if len(component) > 1 or node in graph.get(node, ()):
+                cycle = cycle_through(graph, component, node)
+                cycle_str = " → ".join(nodes[i].name for i in cycle)
                 conflicts.append(f"❌ HIGH: Circular dependency detected:\n  {cycle_str}")
 
         return conflicts
@@ -234,34 +391,34 @@ class IntegrationValidator:
         warnings = []
 
         for file_path in modified_files:
+            name = file_path.name
+
             # Skip test files themselves
-            if 'test' in file_path.name:
+            if 'test' in name:
                 continue
 
-            # Skip non-code files
-            if file_path.suffix not in ['.ts', '.tsx', '.js', '.jsx']:
+            # Skip non-code files (split the name once rather than
+            # computing Path.suffix and Path.stem separately)
+            stem, suffix = os.path.splitext(name)
+            if suffix not in _CODE_SUFFIXES:
                 continue
 
-            # Check if test file exists
-            test_extensions = ['.test.ts', '.test.tsx', '.test.js', '.test.jsx']
-            test_exists = False
-
-            for test_ext in test_extensions:
-                test_file = file_path.with_suffix(test_ext)
-                if test_file.exists():
-                    test_exists = True
-                    break
+            # Check if a sibling test file exists (one cached directory
+            # listing per folder instead of a stat per test extension)
+            sibling_files = self._dir_listing(str(file_path.parent))[0]
+            test_exists = any(stem + test_ext in sibling_files for test_ext in _TEST_EXTENSIONS)
 
             if not test_exists:
                 # Determine severity based on file type
-                if 'hooks' in str(file_path):
+                path_str = str(file_path)
+                if 'hooks' in path_str:
                     severity = "CRITICAL"  # Hooks require 100% coverage
-                elif 'lib' in str(file_path):
+                elif 'lib' in path_str:
                     severity = "HIGH"      # Utilities should have high coverage
                 else:
                     severity = "MEDIUM"    # Components can be tested later
 
-                warnings.append(f"⚠️  {severity}: Missing test file for {file_path.name}")
+                warnings.append(f"⚠️  {severity}: Missing test file for {name}")
 
         return warnings
 
@@ -282,11 +439,14 @@ class IntegrationValidator:
         """
         conflicts = []
 
-        for store_name, definition in store_definitions.items():
-            # Extract property names from interface
-            # Simple regex - assumes format: "propertyName: type"
-            properties = set(re.findall(r'(\w+):\s*\w+', definition))
+        # Parse each store interface once into its property names
+        # Simple regex - assumes format: "propertyName: type"
+        defined_properties = {
+            store_name: frozenset(_STORE_PROPERTY_RE.findall(definition))
+            for store_name, definition in store_definitions.items()
+        }
 
+        for store_name, properties in defined_properties.items():
             # Check usages
             for file_path, accessed_props in store_usages.items():
                 for prop in accessed_props:
@@ -309,6 +469,20 @@ class IntegrationValidator:
         Returns:
             (success: bool, report: str)
         """
+        # Directory listings and persisted imports are only reused within
+        # this run, so edits between runs are always seen
+        self._dir_cache = {}
+        self._imports_cache = self._load_imports_cache() if self.cache_path is not None else None
+        try:
+            return self._run_all_validations(agent_outputs)
+        finally:
+            if self._imports_cache is not None:
+                self._save_imports_cache(self._imports_cache)
+            self._dir_cache = None
+            self._imports_cache = None
+
+    def _run_all_validations(self, agent_outputs: Dict[str, Dict]) -> Tuple[bool, str]:
+        """Body of run_all_validations, run with the run-scoped caches set."""
         self.conflicts = []
         self.warnings = []
 
@@ -322,9 +496,12 @@ class IntegrationValidator:
         type_conflicts = self.validate_type_safety(interfaces)
         self.conflicts.extend(type_conflicts)
 
+        # Read each touched file once for the contract checks below
+        scanned = scan_agent_files(self.project_root, agent_outputs)
+
         # 2. Store Contract Validation (WAS MISSING!)
         print("🔍 Validating Zustand store contracts...")
-        store_contracts = extract_store_contracts(self.project_root, agent_outputs)
+        store_contracts = extract_store_contracts(self.project_root, agent_outputs, scanned)
         if store_contracts:
             store_conflicts = self.validate_store_contracts(
                 store_contracts['definitions'],
@@ -334,42 +511,63 @@ class IntegrationValidator:
 
         # 3. API Contract Validation (component props) - WAS MISSING!
         print("🔍 Validating component API contracts...")
-        api_conflicts = validate_component_props(self.project_root, agent_outputs)
+        api_conflicts = validate_component_props(self.project_root, agent_outputs, scanned)
         self.conflicts.extend(api_conflicts)
 
         # 4. Race Condition Detection (WAS MISSING!)
         print("🔍 Detecting potential race conditions...")
-        race_conditions = detect_race_conditions(self.project_root, agent_outputs)
+        race_conditions = detect_race_conditions(self.project_root, agent_outputs, scanned)
         self.warnings.extend(race_conditions)
 
         # 5. Import Validation
         print("🔍 Checking imports and dependencies...")
         all_files = []
         for output in agent_outputs.values():
-            for file_path_str in output.get('filesModified', []) + output.get('filesCreated', []):
+            for file_path_str in chain(output.get('filesModified', ()), output.get('filesCreated', ())):
                 file_path = self.project_root / file_path_str
                 all_files.append(file_path)
 
+        # Parse and resolve each file's imports once for both checks below.
+        # Reads and directory listings are I/O-bound, so larger sets of files
+        # are scanned on a thread pool (the caches tolerate duplicate fills)
+        unique_files = list(dict.fromkeys(all_files))
+        if len(unique_files) >= _PARALLEL_SCAN_MIN_FILES:
+            with ThreadPoolExecutor() as executor:
+                scanned_imports = dict(zip(unique_files, executor.map(self._scan_imports, unique_files)))
+        else:
+            scanned_imports = {file_path: self._scan_imports(file_path) for file_path in unique_files}
+
         # Check circular dependencies
-        circular_deps = self.detect_circular_dependencies(all_files)
+        circular_deps = self.detect_circular_dependencies(all_files, scanned_imports)
         self.conflicts.extend(circular_deps)
+        dependency_conflicts = list(circular_deps)
 
-        # Check unresolved imports
+        # Check unresolved imports (missing files are reported, but aren't
+        # dependency failures)
         for file_path in all_files:
-            import_conflicts = self.validate_imports(file_path)
+            import_conflicts = self.validate_imports(file_path, scanned_imports)
             self.conflicts.extend(import_conflicts)
+            if scanned_imports[file_path] is not None:
+                dependency_conflicts.extend(import_conflicts)
 
         # 6. Test Coverage Validation
         print("🔍 Validating test coverage...")
         test_warnings = self.validate_test_coverage(all_files)
         self.warnings.extend(test_warnings)
 
+        # Report sections come from the checks that produced them, and
+        # severities are tallied once from each message's "<icon> SEVERITY:" prefix
+        self._type_conflicts = type_conflicts
+        self._dependency_conflicts = dependency_conflicts
+        self._severity_counts = Counter(
+            message.partition(':')[0] for message in chain(self.conflicts, self.warnings)
+        )
+
         # Generate report
         report = self._generate_report(agent_outputs)
 
         # Determine success
-        critical_count = len([c for c in self.conflicts if '❌ CRITICAL' in c])
-        success = critical_count == 0
+        success = self._severity_counts['❌ CRITICAL'] == 0
 
         return success, report
 
@@ -384,7 +582,7 @@ class IntegrationValidator:
 """
 
         # Type Safety
-        type_conflicts = [c for c in self.conflicts if 'Interface' in c and 'conflicting' in c]
+        type_conflicts = self._type_conflicts
         if type_conflicts:
             report += "❌ Type Safety: FAIL (CRITICAL)\n"
             for conflict in type_conflicts:
@@ -396,7 +594,7 @@ class IntegrationValidator:
             report += "   - 0 conflicts detected\n\n"
 
         # Dependencies
-        dep_conflicts = [c for c in self.conflicts if 'Circular' in c or 'Unresolved' in c]
+        dep_conflicts = self._dependency_conflicts
         if dep_conflicts:
             report += "❌ Dependencies: FAIL (HIGH)\n"
             for conflict in dep_conflicts:
@@ -407,7 +605,7 @@ class IntegrationValidator:
             report += "   - All imports resolve\n\n"
 
         # Test Coverage
-        critical_test_warnings = [w for w in self.warnings if 'CRITICAL' in w]
+        critical_test_warnings = [w for w in self.warnings if w.startswith('⚠️  CRITICAL')]
         if critical_test_warnings:
             report += "❌ Test Coverage: FAIL (CRITICAL)\n"
             for warning in critical_test_warnings:
@@ -424,9 +622,9 @@ class IntegrationValidator:
             report += f"   - {test_count} test files created/modified\n\n"
 
         # Summary
-        critical_count = len([c for c in self.conflicts if '❌ CRITICAL' in c])
-        high_count = len([c for c in self.conflicts if '❌ HIGH' in c])
-        medium_count = len([w for w in self.warnings if '⚠️  MEDIUM' in w])
+        critical_count = self._severity_counts['❌ CRITICAL']
+        high_count = self._severity_counts['❌ HIGH']
+        medium_count = self._severity_counts['⚠️  MEDIUM']
 
         if critical_count > 0:
             report += f"🚨 DEPLOYMENT BLOCKED\n"
@@ -457,7 +655,10 @@ class IntegrationValidator:
 # Example usage
 if __name__ == '__main__':
     # Example validation
-    validator = IntegrationValidator(Path.cwd())
+    validator = IntegrationValidator(
+        Path.cwd(),
+        cache_path=Path(__file__).parent / '.validate_cache.json'
+    )
 
     # Mock agent outputs
     agent_outputs = {
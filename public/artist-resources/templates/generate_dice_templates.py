@@ -66,27 +66,26 @@ def create_dice_material(name, color):
 
     return mat
 
-# D4 - Tetrahedron
-def create_d4():
-    """Create a D4 (tetrahedron) dice"""
-    bpy.ops.mesh.primitive_ico_sphere_add(
-        subdivisions=0,
-        radius=0.6,
-        location=(0, 0, 0)
-    )
-    obj = bpy.context.active_object
-    obj.name = "D4_Template"
+# Build a mesh object directly from vertex/face tables (no operators or edit mode)
+def create_mesh_object(name, verts, faces):
+    """Create and link a mesh object from vertices and faces"""
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(verts, [], faces)
+    mesh.update()
 
-    # Convert to tetrahedron (4 faces)
-    bpy.ops.object.mode_set(mode='EDIT')
-    bm = bmesh.from_edit_mesh(obj.data)
+    obj = bpy.data.objects.new(name, mesh)
+    bpy.context.collection.objects.link(obj)
 
-    # Keep only 4 vertices to make tetrahedron
-    verts_to_remove = list(bm.verts)[4:]
-    bmesh.ops.delete(bm, geom=verts_to_remove, context='VERTS')
+    return obj
 
-    bmesh.update_edit_mesh(obj.data)
-    bpy.ops.object.mode_set(mode='OBJECT')
+# D4 - Tetrahedron
+def create_d4():
+    """Create a D4 (tetrahedron) dice"""
+    # Alternate cube corners, scaled to a 0.6 circumradius
+    r = 0.6 / math.sqrt(3)
+    verts = [(r, r, r), (r, -r, -r), (-r, r, -r), (-r, -r, r)]
+    faces = [(0, 1, 2), (0, 3, 1), (0, 2, 3), (1, 3, 2)]
+    obj = create_mesh_object("D4_Template", verts, faces)
 
     # Add material
     mat = create_dice_material("D4_Material", (1.0, 0.2, 0.2, 1.0))  # Red
@@ -124,24 +123,14 @@ def create_d6():
 # D8 - Octahedron
 def create_d8():
     """Create a D8 (octahedron) dice"""
-    bpy.ops.mesh.primitive_ico_sphere_add(
-        subdivisions=0,
-        radius=0.7,
-        location=(0, 0, 0)
-    )
-    obj = bpy.context.active_object
-    obj.name = "D8_Template"
-
-    # Convert to octahedron (8 faces)
-    bpy.ops.object.mode_set(mode='EDIT')
-    bm = bmesh.from_edit_mesh(obj.data)
-
-    # Keep 6 vertices to make octahedron
-    verts_to_remove = list(bm.verts)[6:]
-    bmesh.ops.delete(bm, geom=verts_to_remove, context='VERTS')
-
-    bmesh.update_edit_mesh(obj.data)
-    bpy.ops.object.mode_set(mode='OBJECT')
+    # Axis points at a 0.7 circumradius
+    r = 0.7
+    verts = [(r, 0, 0), (-r, 0, 0), (0, r, 0), (0, -r, 0), (0, 0, r), (0, 0, -r)]
+    faces = [
+        (0, 2, 4), (2, 1, 4), (1, 3, 4), (3, 0, 4),
+        (2, 0, 5), (1, 2, 5), (3, 1, 5), (0, 3, 5)
+    ]
+    obj = create_mesh_object("D8_Template", verts, faces)
 
     # Add material
     mat = create_dice_material("D8_Material", (0.2, 0.8, 0.4, 1.0))  # Green
@@ -227,22 +216,24 @@ def finalize_all_dice():
     """Apply all transforms and set origins"""
     for obj in bpy.data.objects:
         if obj.type == 'MESH':
-            # Select object
-            bpy.ops.object.select_all(action='DESELECT')
-            obj.select_set(True)
-            bpy.context.view_layer.objects.active = obj
-
-            # Set origin to geometry
-            bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY', center='BOUNDS')
-
-            # Apply all transforms
-            bpy.ops.object.transform_apply(location=False, rotation=True, scale=True)
-
-            # Recalculate normals
-            bpy.ops.object.mode_set(mode='EDIT')
-            bpy.ops.mesh.select_all(action='SELECT')
-            bpy.ops.mesh.normals_consistent(inside=False)
-            bpy.ops.object.mode_set(mode='OBJECT')
+            # Run the object operators against this object only, no selection changes
+            with bpy.context.temp_override(
+                active_object=obj, object=obj,
+                selected_objects=[obj], selected_editable_objects=[obj]
+            ):
+                # Set origin to geometry
+                bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY', center='BOUNDS')
+
+                # Apply all transforms
+                bpy.ops.object.transform_apply(location=False, rotation=True, scale=True)
+
+            # Recalculate normals on the mesh data (no edit mode round trip)
+            bm = bmesh.new()
+            bm.from_mesh(obj.data)
+            bmesh.ops.recalc_face_normals(bm, faces=bm.faces)
+            bm.to_mesh(obj.data)
+            bm.free()
+            obj.data.update()
 
 # Add lights and camera
 def setup_scene():